@@ -9,7 +9,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from infrastructure.database.models import Base
 from infrastructure.database.models.user_model import UserModel
-from infrastructure.database.models.todo_model import TodoModel
+from infrastructure.database.models.todo_model import TodoModel, is_search_schema_object
+from infrastructure.database.models.todo_counter_model import TodoCounterModel
 
 # this is the Alembic Config object
 config = context.config
@@ -32,6 +33,12 @@ if config.config_file_name is not None:
 # Set target metadata for auto-generation
 target_metadata = Base.metadata
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the full-text search objects, created by raw DDL, out of autogenerate"""
+    if reflected and compare_to is None and is_search_schema_object(name):
+        return False
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     url = config.get_main_option("sqlalchemy.url")
@@ -40,6 +47,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -55,7 +63,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,33 @@
+"""Add (user_id, created_at, id) index to todos
+
+Revision ID: 3c9e1f7a2b64
+Revises: daaa297e9128
+Create Date: 2026-10-18 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1f7a2b64'
+down_revision: Union[str, Sequence[str], None] = 'daaa297e9128'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_todos_user_id_created_at_id',
+        'todos',
+        ['user_id', 'created_at', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_user_id_created_at_id', table_name='todos')
@@ -0,0 +1,28 @@
+"""Add todos_version to users
+
+Revision ID: a41d6e0c8f13
+Revises: 3c9e1f7a2b64
+Create Date: 2026-10-18 14:03:27.884106
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d6e0c8f13'
+down_revision: Union[str, Sequence[str], None] = '3c9e1f7a2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('todos_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'todos_version')
@@ -0,0 +1,74 @@
+"""Add full-text search over todos
+
+Revision ID: b7d2e5f90a31
+Revises: a41d6e0c8f13
+Create Date: 2026-10-18 16:21:42.517093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e5f90a31'
+down_revision: Union[str, Sequence[str], None] = 'a41d6e0c8f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE todos_fts USING fts5(
+                title, description, content='todos', content_rowid='rowid', tokenize='porter unicode61'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER todos_fts_insert AFTER INSERT ON todos BEGIN
+                INSERT INTO todos_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER todos_fts_delete AFTER DELETE ON todos BEGIN
+                INSERT INTO todos_fts (todos_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER todos_fts_update AFTER UPDATE OF title, description ON todos BEGIN
+                INSERT INTO todos_fts (todos_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+                INSERT INTO todos_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+            END
+        """)
+        # Index the rows that already exist
+        op.execute("INSERT INTO todos_fts (todos_fts) VALUES ('rebuild')")
+        return
+    
+    # Generated columns are filled in for existing rows as the table is rewritten
+    op.add_column('todos', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_todos_search_vector', 'todos', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS todos_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS todos_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS todos_fts_insert")
+        op.execute("DROP TABLE IF EXISTS todos_fts")
+        return
+    
+    op.drop_index('ix_todos_search_vector', table_name='todos', postgresql_using='gin')
+    op.drop_column('todos', 'search_vector')
@@ -0,0 +1,44 @@
+"""Add partial indexes for completed and pending todos
+
+Revision ID: c5e8a1d3f7b2
+Revises: b7d2e5f90a31
+Create Date: 2026-10-18 17:02:11.093518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a1d3f7b2'
+down_revision: Union[str, Sequence[str], None] = 'b7d2e5f90a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_todos_user_id_created_at_id_completed',
+        'todos',
+        ['user_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('completed = true'),
+        sqlite_where=sa.text('completed = 1')
+    )
+    op.create_index(
+        'ix_todos_user_id_created_at_id_pending',
+        'todos',
+        ['user_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('completed = false'),
+        sqlite_where=sa.text('completed = 0')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_user_id_created_at_id_pending', table_name='todos')
+    op.drop_index('ix_todos_user_id_created_at_id_completed', table_name='todos')
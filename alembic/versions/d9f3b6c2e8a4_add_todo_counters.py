@@ -0,0 +1,43 @@
+"""Add todo_counters
+
+Revision ID: d9f3b6c2e8a4
+Revises: c5e8a1d3f7b2
+Create Date: 2026-10-18 18:12:54.630217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9f3b6c2e8a4'
+down_revision: Union[str, Sequence[str], None] = 'c5e8a1d3f7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'todo_counters',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('total', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('completed', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    # Start from the todos that already exist
+    op.execute("""
+        INSERT INTO todo_counters (user_id, total, completed, updated_at)
+        SELECT user_id, COUNT(*), SUM(CASE WHEN completed THEN 1 ELSE 0 END), CURRENT_TIMESTAMP
+        FROM todos
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('todo_counters')
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading todos as domain entities, ORM hydration vs Core rows.
+
+Seeds one user with --todos todos (default 10k), then loads all of them
+as Todo entities both ways, each in its own session:
+
+- orm: the previous read path. select(TodoModel) builds an ORM instance
+  per row, tracked in the session's identity map, and copies it into an
+  unslotted Todo (a copy of the entity before __slots__ was added).
+- rows: TodoRepositoryImpl.get_by_user_id, which selects the columns and
+  builds slotted Todo entities straight from the rows.
+
+Reports the best time of --repeat runs and, from tracemalloc, the peak
+heap during a load and what the loaded entities still hold afterwards.
+
+Usage:
+    python -m benchmarks.entity_hydration
+    DATABASE_URL=... python -m benchmarks.entity_hydration --todos 10000
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+# Time the read paths alone, without the statement profiler's hooks
+os.environ.setdefault("SQL_PROFILER_ENABLED", "false")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, delete, select
+
+from src.domain.entities.todo import Todo
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+
+
+class UnslottedTodo:
+    """Todo as it was before __slots__, with a per-instance __dict__"""
+
+    def __init__(self, id: str, user_id: str, title: str, description: str = "", completed: bool = False,
+                 created_at: Optional[datetime] = None, completed_at: Optional[datetime] = None):
+        self.id = id
+        self.user_id = user_id
+        self.title = title
+        self.description = description
+        self.completed = completed
+        self.created_at = created_at or datetime.utcnow()
+        self.completed_at = completed_at
+
+
+async def seed(todos: int) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(days=30)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(
+            id=user_id,
+            username=f"bench-{user_id.hex[:12]}",
+            email=f"bench-{user_id.hex[:12]}@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=datetime.utcnow()
+        ))
+        for offset in range(0, todos, 10000):
+            await conn.execute(insert(TodoModel), [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "title": f"todo number {i}",
+                    "description": "a todo loaded by the hydration benchmark",
+                    "completed": i % 3 == 0,
+                    "created_at": start + timedelta(seconds=i),
+                    "completed_at": start if i % 3 == 0 else None
+                }
+                for i in range(offset, min(offset + 10000, todos))
+            ])
+    return user_id
+
+
+async def load_orm(session, user_id: uuid.UUID) -> list:
+    result = await session.execute(select(TodoModel).where(TodoModel.user_id == user_id))
+    return [
+        UnslottedTodo(
+            id=str(model.id),
+            user_id=str(model.user_id),
+            title=model.title,
+            description=model.description or "",
+            completed=model.completed,
+            created_at=model.created_at,
+            completed_at=model.completed_at
+        )
+        for model in result.scalars().all()
+    ]
+
+
+async def load_rows(session, user_id: uuid.UUID) -> list:
+    return await TodoRepositoryImpl(session).get_by_user_id(str(user_id))
+
+
+async def best_time(load, user_id: uuid.UUID, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        async with AsyncSessionLocal() as session:
+            started = time.perf_counter()
+            await load(session, user_id)
+            timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def memory(load, user_id: uuid.UUID) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        async with AsyncSessionLocal() as session:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            todos = await load(session, user_id)
+            gc.collect()
+            held, peak = tracemalloc.get_traced_memory()
+            del todos
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes": peak - before,
+        "held_bytes": held - before
+    }
+
+
+def entity_bytes(entity) -> int:
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(entity.__dict__)
+    return size
+
+
+async def sample_entities(user_id: uuid.UUID):
+    """One entity from each path, to compare their own sizes"""
+    async with AsyncSessionLocal() as session:
+        unslotted = (await load_orm(session, user_id))[0]
+        slotted = (await load_rows(session, user_id))[0]
+    assert isinstance(slotted, Todo)
+    return unslotted, slotted
+
+
+async def main(args) -> dict:
+    await create_tables()
+    user_id = await seed(args.todos)
+    try:
+        # Warm up statement caches and connections
+        for load in (load_orm, load_rows):
+            await best_time(load, user_id, 1)
+
+        results = {}
+        for name, load in (("orm", load_orm), ("rows", load_rows)):
+            seconds = await best_time(load, user_id, args.repeat)
+            results[name] = {
+                "ms": round(seconds * 1000, 2),
+                "us_per_todo": round(seconds / args.todos * 1e6, 3),
+                **await memory(load, user_id)
+            }
+
+        orm, rows = results["orm"], results["rows"]
+        unslotted, slotted = await sample_entities(user_id)
+        return {
+            "todos": args.todos,
+            "database": engine.dialect.name,
+            "results": results,
+            "entity_bytes": {"unslotted": entity_bytes(unslotted), "slotted": entity_bytes(slotted)},
+            "saved": {
+                "ms": round(orm["ms"] - rows["ms"], 2),
+                "time_pct": round((orm["ms"] - rows["ms"]) / orm["ms"] * 100, 1),
+                "peak_bytes": orm["peak_bytes"] - rows["peak_bytes"],
+                "held_bytes": orm["held_bytes"] - rows["held_bytes"],
+                "held_pct": round((orm["held_bytes"] - rows["held_bytes"]) / orm["held_bytes"] * 100, 1)
+            }
+        }
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(delete(TodoModel).where(TodoModel.user_id == user_id))
+            await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time and memory to load todos as entities, ORM vs Core rows")
+    parser.add_argument("--todos", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    print(json.dumps(asyncio.run(main(parser.parse_args())), indent=2))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory while exporting a large todo history.
+
+Seeds one user with N todos, then consumes TodoService.export_user_todos
+chunk by chunk (as StreamingResponse would) and reports peak Python heap
+(tracemalloc) and peak RSS growth. Both should stay flat as N grows.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.export_memory --rows 1000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, delete
+
+from src.infrastructure.database.connection import engine, AsyncReadSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+from src.infrastructure.database.repo.user_repository_impl import UserRepositoryImpl
+from src.application.services.todo_service import TodoService
+
+
+async def seed(rows: int) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(days=365)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(
+            id=user_id,
+            username=f"bench-{user_id.hex[:12]}",
+            email=f"bench-{user_id.hex[:12]}@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=datetime.utcnow()
+        ))
+        for offset in range(0, rows, 10000):
+            await conn.execute(insert(TodoModel), [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "title": f"todo number {i}",
+                    "description": "exported description",
+                    "completed": False,
+                    "created_at": start + timedelta(seconds=i),
+                    "completed_at": None
+                }
+                for i in range(offset, min(offset + 10000, rows))
+            ])
+    return user_id
+
+
+async def cleanup(user_id: uuid.UUID):
+    async with engine.begin() as conn:
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id == user_id))
+        await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+def rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+async def export(user_id: uuid.UUID, export_format: str, chunk_size: int) -> dict:
+    async with AsyncReadSessionLocal() as session:
+        service = TodoService(TodoRepositoryImpl(session), UserRepositoryImpl(session))
+        rss_before = rss_kb()
+        tracemalloc.start()
+        started = time.perf_counter()
+        
+        exported_bytes = 0
+        chunks = await service.export_user_todos(str(user_id), export_format, chunk_size)
+        async for chunk in chunks:
+            exported_bytes += len(chunk)
+        
+        elapsed = time.perf_counter() - started
+        _, heap_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            "format": export_format,
+            "bytes": exported_bytes,
+            "seconds": round(elapsed, 2),
+            "heap_peak_mb": round(heap_peak / 1024 / 1024, 2),
+            "rss_growth_mb": round((rss_kb() - rss_before) / 1024, 2)
+        }
+
+
+async def main(args):
+    await create_tables()
+    user_id = await seed(args.rows)
+    try:
+        results = [await export(user_id, export_format, args.chunk_size) for export_format in ("ndjson", "csv")]
+        print(json.dumps({
+            "database": engine.url.get_backend_name(),
+            "rows": args.rows,
+            "chunk_size": args.chunk_size,
+            "results": results
+        }, indent=2))
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak memory of a streaming todo export")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
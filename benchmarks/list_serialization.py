@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-row cost of building a todo list response.
+
+Compares, for one page of N todos read from the configured database:
+  - entity path: column tuples -> Todo -> TodoResponse.from_entity, then
+    response_model re-validation and JSON encoding as FastAPI does it
+  - fast path:   column tuples -> encode_todo_page, straight to JSON bytes
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.list_serialization --rows 10000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter
+from sqlalchemy import insert, delete
+
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+from src.application.dtos.todo.todo_response import TodoResponse
+from src.application.dtos.todo.todo_page import TodoPageResponse
+from src.application.dtos.todo.todo_page_json import encode_todo_page
+
+page_adapter = TypeAdapter(TodoPageResponse)
+
+
+async def seed(rows: int) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(days=30)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(
+            id=user_id,
+            username=f"bench-{user_id.hex[:12]}",
+            email=f"bench-{user_id.hex[:12]}@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=datetime.utcnow()
+        ))
+        await conn.execute(insert(TodoModel), [
+            {
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": f"todo number {i}",
+                "description": "some description text" if i % 2 else "",
+                "completed": i % 3 == 0,
+                "created_at": start + timedelta(seconds=i),
+                "completed_at": start + timedelta(seconds=i + 1) if i % 3 == 0 else None
+            }
+            for i in range(rows)
+        ])
+    return user_id
+
+
+async def cleanup(user_id: uuid.UUID):
+    async with engine.begin() as conn:
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id == user_id))
+        await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+async def entity_path(repo: TodoRepositoryImpl, user_id: str, rows: int) -> bytes:
+    todos = [repo._row_to_entity(row) for row in await repo.get_page_rows_by_user_id(user_id, rows)]
+    page = TodoPageResponse(items=[TodoResponse.from_entity(todo) for todo in todos], next_cursor=None)
+    # What FastAPI does with a returned model and response_model=TodoPageResponse
+    validated = page_adapter.validate_python(page, from_attributes=True)
+    return json.dumps(page_adapter.dump_python(validated, mode="json")).encode()
+
+
+async def fast_path(repo: TodoRepositoryImpl, user_id: str, rows: int) -> bytes:
+    return encode_todo_page(await repo.get_page_rows_by_user_id(user_id, rows), None)
+
+
+async def measure(path, user_id: str, rows: int, samples: int) -> dict:
+    timings = []
+    async with AsyncSessionLocal() as session:
+        repo = TodoRepositoryImpl(session)
+        await path(repo, user_id, rows)  # warm up
+        for _ in range(samples):
+            session.expunge_all()
+            started = time.perf_counter()
+            body = await path(repo, user_id, rows)
+            timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return {
+        "median_ms": round(median * 1000, 2),
+        "us_per_row": round(median / rows * 1e6, 3),
+        "bytes": len(body)
+    }
+
+
+async def main(args):
+    await create_tables()
+    user_id = await seed(args.rows)
+    try:
+        entity = await measure(entity_path, str(user_id), args.rows, args.samples)
+        fast = await measure(fast_path, str(user_id), args.rows, args.samples)
+        print(json.dumps({
+            "database": engine.url.get_backend_name(),
+            "rows": args.rows,
+            "samples": args.samples,
+            "entity_path": entity,
+            "fast_path": fast,
+            "speedup": round(entity["median_ms"] / fast["median_ms"], 1)
+        }, indent=2))
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-row list serialization cost")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--samples", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Load harness: mixed workload against the real API, per-route latency.
+
+Drives create_app() either in process through httpx's ASGI transport
+(default), through a uvicorn server started in this process (--uvicorn),
+or against a server that is already running (--base-url). Seeds users
+and todos through the API, then runs a weighted mix of operations from
+--concurrency workers for --duration seconds and prints throughput and
+p50/p95/p99 per route as JSON. Save runs with --output and compare two
+of them with --compare.
+
+In-process runs create the tables in DATABASE_URL and delete the users
+they seeded afterwards; point DATABASE_URL at a scratch database. Runs
+against --base-url leave their users behind.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.load_harness --duration 30 --output before.json
+    DATABASE_URL=... python -m benchmarks.load_harness --mix list=60,create=20,complete=10,delete=10
+    python -m benchmarks.load_harness --base-url http://localhost:8090 --users 50
+    python -m benchmarks.load_harness --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+DEFAULT_MIX = "list=40,get=10,create=15,update=5,complete=10,delete=5,stats=5,search=3,me=3,login=3,register=1"
+PASSWORD = "load-harness-password"
+BULK_CHUNK = 1000
+
+
+class SeededUser:
+    """A user the workers act as, with the todo ids they know about"""
+
+    def __init__(self, email: str, token: str):
+        self.email = email
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.pending = []
+        self.completed = []
+
+
+class Workload:
+    """Shared state of a run: the users, and latencies recorded per route"""
+
+    def __init__(self, client: httpx.AsyncClient, run_id: str, rng: random.Random):
+        self.client = client
+        self.run_id = run_id
+        self.rng = rng
+        self.users = []
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    async def request(self, route: str, method: str, url: str, ok=(200,), **kwargs) -> httpx.Response:
+        """Send one request and record its latency under the route template"""
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.latencies[route].append(time.perf_counter() - started)
+        self.statuses[route][response.status_code] += 1
+        if response.status_code not in ok:
+            self.errors[route] += 1
+        return response
+
+    async def register_and_login(self, record: bool = True) -> SeededUser:
+        name = f"load-{self.run_id}-{uuid.uuid4().hex[:12]}"
+        email = f"{name}@example.com"
+        body = {"username": name, "email": email, "password": PASSWORD}
+        login = {"email": email, "password": PASSWORD}
+        if record:
+            await self.request("POST /api/users/register", "POST", "/api/users/register", json=body)
+            response = await self.request("POST /api/users/login", "POST", "/api/users/login", json=login)
+        else:
+            (await self.client.post("/api/users/register", json=body)).raise_for_status()
+            response = await self.client.post("/api/users/login", json=login)
+            response.raise_for_status()
+        return SeededUser(email, response.json()["access_token"])
+
+    def user(self) -> SeededUser:
+        return self.rng.choice(self.users)
+
+
+async def op_register(w: Workload):
+    w.users.append(await w.register_and_login())
+
+
+async def op_login(w: Workload):
+    user = w.user()
+    await w.request("POST /api/users/login", "POST", "/api/users/login", json={"email": user.email, "password": PASSWORD})
+
+
+async def op_me(w: Workload):
+    await w.request("GET /api/users/me", "GET", "/api/users/me", headers=w.user().headers)
+
+
+async def op_create(w: Workload):
+    user = w.user()
+    response = await w.request(
+        "POST /api/todos/", "POST", "/api/todos/",
+        json={"title": f"load {w.rng.randrange(1_000_000)}", "description": "created by the load harness"},
+        headers=user.headers
+    )
+    if response.status_code == 200:
+        user.pending.append(response.json()["id"])
+
+
+async def op_list(w: Workload):
+    user = w.user()
+    params = {"limit": 50}
+    if w.rng.random() < 0.2:
+        params["status"] = w.rng.choice(["pending", "completed"])
+    await w.request("GET /api/todos/", "GET", "/api/todos/", params=params, headers=user.headers)
+
+
+async def op_get(w: Workload):
+    user = w.user()
+    todo_ids = user.pending or user.completed
+    if not todo_ids:
+        return await op_create(w)
+    await w.request("GET /api/todos/{todo_id}", "GET", f"/api/todos/{w.rng.choice(todo_ids)}", headers=user.headers)
+
+
+async def op_update(w: Workload):
+    user = w.user()
+    if not user.pending:
+        return await op_create(w)
+    todo_id = w.rng.choice(user.pending)
+    await w.request(
+        "PUT /api/todos/{todo_id}", "PUT", f"/api/todos/{todo_id}",
+        json={"title": f"renamed {w.rng.randrange(1_000_000)}"},
+        # Another worker may have completed it in the meantime
+        ok=(200, 400), headers=user.headers
+    )
+
+
+async def op_complete(w: Workload):
+    user = w.user()
+    if not user.pending:
+        return await op_create(w)
+    todo_id = user.pending.pop(w.rng.randrange(len(user.pending)))
+    response = await w.request(
+        "PUT /api/todos/{todo_id}/complete", "PUT", f"/api/todos/{todo_id}/complete", headers=user.headers
+    )
+    if response.status_code == 200:
+        user.completed.append(todo_id)
+
+
+async def op_delete(w: Workload):
+    user = w.user()
+    pool = user.completed if user.completed and w.rng.random() < 0.5 else user.pending
+    if not pool:
+        return await op_create(w)
+    todo_id = pool.pop(w.rng.randrange(len(pool)))
+    await w.request("DELETE /api/todos/{todo_id}", "DELETE", f"/api/todos/{todo_id}", headers=user.headers)
+
+
+async def op_stats(w: Workload):
+    await w.request("GET /api/todos/stats", "GET", "/api/todos/stats", headers=w.user().headers)
+
+
+async def op_search(w: Workload):
+    await w.request(
+        "GET /api/todos/search", "GET", "/api/todos/search",
+        params={"q": w.rng.choice(["load", "renamed", "harness", "seed"])}, headers=w.user().headers
+    )
+
+
+OPERATIONS = {
+    "register": op_register,
+    "login": op_login,
+    "me": op_me,
+    "create": op_create,
+    "list": op_list,
+    "get": op_get,
+    "update": op_update,
+    "complete": op_complete,
+    "delete": op_delete,
+    "stats": op_stats,
+    "search": op_search,
+}
+
+
+def parse_mix(mix: str) -> dict:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise SystemExit(f"Unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+async def seed(w: Workload, users: int, todos_per_user: int, concurrency: int):
+    """Register and log in `users` users, each with `todos_per_user` todos (unrecorded)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def seed_user():
+        async with semaphore:
+            user = await w.register_and_login(record=False)
+            remaining = todos_per_user
+            while remaining:
+                count = min(remaining, BULK_CHUNK)
+                todos = [{"title": f"seed {i}", "description": "seeded by the load harness"} for i in range(count)]
+                response = await w.client.post("/api/todos/bulk", json={"todos": todos}, headers=user.headers)
+                response.raise_for_status()
+                user.pending.extend(todo["id"] for todo in response.json())
+                remaining -= count
+            w.users.append(user)
+
+    await asyncio.gather(*(seed_user() for _ in range(users)))
+
+
+async def run_workload(w: Workload, weights: dict, duration: float, concurrency: int) -> float:
+    names = list(weights)
+    weight_values = list(weights.values())
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            name = w.rng.choices(names, weights=weight_values)[0]
+            await OPERATIONS[name](w)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+
+def percentile(samples, fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def summarize(w: Workload, elapsed: float) -> dict:
+    routes = {}
+    for route, samples in sorted(w.latencies.items()):
+        samples = sorted(samples)
+        routes[route] = {
+            "requests": len(samples),
+            "errors": w.errors[route],
+            "statuses": {str(code): count for code, count in sorted(w.statuses[route].items())},
+            "throughput_rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(statistics.median(samples) * 1000, 2),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+            "max_ms": round(samples[-1] * 1000, 2),
+        }
+    total = sum(route["requests"] for route in routes.values())
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "requests": total,
+        "errors": sum(w.errors.values()),
+        "throughput_rps": round(total / elapsed, 1),
+        "routes": routes,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def cleanup(run_id: str):
+    """Delete the users (and their todos) an in-process run created"""
+    from sqlalchemy import delete, select
+    from src.infrastructure.database.connection import engine
+    from src.infrastructure.database.models import UserModel, TodoModel, TodoCounterModel
+
+    async with engine.begin() as conn:
+        user_ids = select(UserModel.id).where(UserModel.email.like(f"load-{run_id}-%"))
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id.in_(user_ids)))
+        await conn.execute(delete(TodoCounterModel).where(TodoCounterModel.user_id.in_(user_ids)))
+        await conn.execute(delete(UserModel).where(UserModel.email.like(f"load-{run_id}-%")))
+
+
+async def start_uvicorn(app, port: int):
+    import uvicorn
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    return server, task
+
+
+async def main(args):
+    run_id = uuid.uuid4().hex[:8]
+    rng = random.Random(args.seed)
+    weights = parse_mix(args.mix)
+    in_process = args.base_url is None
+    server = server_task = None
+
+    if in_process:
+        from src.infrastructure.database.connection import create_tables, close_engine, engine
+        from src.presentation.app import create_app
+
+    try:
+        if in_process:
+            await create_tables()
+            app = create_app()
+            if args.uvicorn:
+                server, server_task = await start_uvicorn(app, args.port)
+                client = httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", timeout=60)
+                target = "uvicorn"
+            else:
+                client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=60)
+                target = "asgi"
+        else:
+            client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+            target = args.base_url
+
+        async with client:
+            w = Workload(client, run_id, rng)
+            await seed(w, args.users, args.todos_per_user, args.concurrency)
+            elapsed = await run_workload(w, weights, args.duration, args.concurrency)
+        result = {
+            "commit": git_commit(),
+            "target": target,
+            "database": engine.url.get_backend_name() if in_process else "remote",
+            "config": {
+                "users": args.users,
+                "todos_per_user": args.todos_per_user,
+                "concurrency": args.concurrency,
+                "duration_s": args.duration,
+                "mix": weights,
+                "seed": args.seed,
+            },
+            **summarize(w, elapsed),
+        }
+    finally:
+        if server is not None:
+            server.should_exit = True
+            await server_task
+        if in_process:
+            await cleanup(run_id)
+            await close_engine()
+
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+def compare(baseline_path: str, candidate_path: str):
+    """Print per-route changes from one saved run to another"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+
+    def change(before, after):
+        return round((after - before) / before * 100, 1) if before else None
+
+    routes = {}
+    for route, after in candidate["routes"].items():
+        before = baseline["routes"].get(route)
+        if before is None:
+            continue
+        routes[route] = {
+            metric: {"before": before[metric], "after": after[metric], "change_pct": change(before[metric], after[metric])}
+            for metric in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+    print(json.dumps({
+        "baseline": baseline.get("commit"),
+        "candidate": candidate.get("commit"),
+        "throughput_rps": {
+            "before": baseline["throughput_rps"],
+            "after": candidate["throughput_rps"],
+            "change_pct": change(baseline["throughput_rps"], candidate["throughput_rps"]),
+        },
+        "routes": routes,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mixed-workload load test with per-route latency percentiles")
+    parser.add_argument("--base-url", help="Run against this already-running server instead of in process")
+    parser.add_argument("--uvicorn", action="store_true", help="Serve the in-process app through uvicorn on --port")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--todos-per-user", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of mixed workload after seeding")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Comma-separated operation=weight pairs")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the operation sequence")
+    parser.add_argument("--output", help="Also write the JSON result to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="Compare two saved runs and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        asyncio.run(main(args))
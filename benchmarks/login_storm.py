@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: event-loop lag during a login storm.
+
+Runs a burst of concurrent password verifications while a probe
+coroutine measures how late the loop wakes it up. Compares scrypt
+computed inline on the loop with the PasswordHasher thread pool.
+
+Usage:
+    python -m benchmarks.login_storm --logins 200
+"""
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.auth.password_hasher import PasswordHasher
+
+
+async def probe(lags, stop: asyncio.Event, interval: float = 0.001):
+    """Record how far past the requested wake-up time each sleep returns"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+def summarize(lags, elapsed: float, logins: int) -> dict:
+    lags = sorted(lags) or [0.0]
+    return {
+        "logins_per_sec": round(logins / elapsed, 1),
+        "loop_lag_p50_ms": round(statistics.median(lags) * 1000, 2),
+        "loop_lag_p99_ms": round(lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000, 2),
+        "loop_lag_max_ms": round(lags[-1] * 1000, 2)
+    }
+
+
+async def storm(verify, logins: int) -> dict:
+    lags, stop = [], asyncio.Event()
+    probe_task = asyncio.create_task(probe(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(verify() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+    return summarize(lags, elapsed, logins)
+
+
+async def main(args):
+    hasher = PasswordHasher()
+    hasher.max_pending = args.logins
+    stored = await hasher.hash("correct horse battery staple")
+    _, n, r, p, salt, _ = stored.split("$")
+    salt = base64.b64decode(salt)
+    
+    async def inline_verify():
+        # What the naive version would do: the KDF runs on the loop thread
+        await asyncio.sleep(0)
+        PasswordHasher._scrypt("correct horse battery staple", salt, int(n), int(r), int(p))
+    
+    async def pooled_verify():
+        assert await hasher.verify("correct horse battery staple", stored)
+    
+    print(json.dumps({
+        "logins": args.logins,
+        "scrypt": {"n": int(n), "r": int(r), "p": int(p)},
+        "inline": await storm(inline_verify, args.logins),
+        "pooled": await storm(pooled_verify, args.logins)
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Event-loop lag under concurrent logins")
+    parser.add_argument("--logins", type=int, default=200)
+    asyncio.run(main(parser.parse_args()))
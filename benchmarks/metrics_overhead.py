@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request cost of MetricsMiddleware and of a /metrics scrape.
+
+1. Bare ASGI: a no-op app called directly vs wrapped in MetricsMiddleware,
+   isolating the middleware's own cost per request.
+2. Full app: GET / through create_app() over httpx's ASGI transport with
+   metrics enabled vs disabled.
+3. Scrape: time to render the registry with the series recorded so far
+   plus --routes synthetic route templates.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.prometheus import metrics_registry
+from src.presentation.middleware.metrics import MetricsMiddleware, http_request_duration_seconds, http_requests_total
+
+
+class _Route:
+    path = "/api/todos/{todo_id}"
+
+
+async def noop_app(scope, receive, send):
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def time_asgi(app, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "path": "/api/todos/x"}, receive, send)
+    return time.perf_counter() - started
+
+
+async def time_full_app(metrics_enabled: bool, requests: int) -> float:
+    from src.presentation.app import create_app
+    settings.metrics_enabled = metrics_enabled
+    app = create_app()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/")
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/")
+        return time.perf_counter() - started
+
+
+def per_request_us(elapsed: float, requests: int) -> float:
+    return round(elapsed / requests * 1e6, 2)
+
+
+async def main(args):
+    bare = min([await time_asgi(noop_app, args.requests) for _ in range(3)])
+    wrapped = min([await time_asgi(MetricsMiddleware(noop_app), args.requests) for _ in range(3)])
+
+    without_metrics = await time_full_app(False, args.requests // 4)
+    with_metrics = await time_full_app(True, args.requests // 4)
+
+    # Synthetic series, as many route templates as a larger app would have
+    for i in range(args.routes):
+        for status in ("200", "404"):
+            http_requests_total.inc(("GET", f"/synthetic/{i}/{{item_id}}", status))
+        http_request_duration_seconds.observe(("GET", f"/synthetic/{i}/{{item_id}}"), 0.01)
+    started = time.perf_counter()
+    body = metrics_registry.render()
+    render_ms = (time.perf_counter() - started) * 1000
+
+    from src.infrastructure.database.connection import close_engine
+    await close_engine()
+
+    print(json.dumps({
+        "requests": args.requests,
+        "bare_asgi": {
+            "without_middleware_us": per_request_us(bare, args.requests),
+            "with_middleware_us": per_request_us(wrapped, args.requests),
+            "overhead_us": per_request_us(wrapped - bare, args.requests),
+        },
+        "full_app_get_root": {
+            "metrics_disabled_us": per_request_us(without_metrics, args.requests // 4),
+            "metrics_enabled_us": per_request_us(with_metrics, args.requests // 4),
+            "overhead_us": per_request_us(with_metrics - without_metrics, args.requests // 4),
+        },
+        "scrape": {
+            "series_lines": body.count("\n"),
+            "bytes": len(body),
+            "render_ms": round(render_ms, 3),
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cost of request metrics per request and per scrape")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--routes", type=int, default=50, help="Extra synthetic route templates for the scrape timing")
+    asyncio.run(main(parser.parse_args()))
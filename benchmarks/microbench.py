@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for per-request hot paths, against an in-memory database.
+
+Times entity mapping (TodoRepositoryImpl._model_to_entity), DTO mapping
+(TodoResponse/UserResponse.from_entity), JWT create/verify, per-request
+dependency construction from src/presentation/dependencies.py and a few
+repository reads on SQLite :memory:. Each case reports ops/sec (best of
+--repeat runs) and memory allocated per call (peak bytes while the call
+runs, and bytes/blocks still held once it returns, which includes the
+result). Save a run as a baseline and diff later runs against it.
+
+Usage:
+    python -m benchmarks.microbench
+    python -m benchmarks.microbench --save before
+    python -m benchmarks.microbench --compare benchmarks/baselines/before.json --fail-above 10
+    python -m benchmarks.microbench -k jwt
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+# Always an in-memory database, whatever the environment points at
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
+os.environ.pop("DATABASE_READ_URL", None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert
+
+from src.infrastructure.auth.jwt_handler import JWTHandler
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables, get_session
+from src.infrastructure.database.models import UserModel, TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+from src.infrastructure.database.repo.user_repository_impl import UserRepositoryImpl
+from src.application.dtos.todo.todo_response import TodoResponse
+from src.application.dtos.user.user_response import UserResponse
+from src.presentation import dependencies
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+SEEDED_TODOS = 1000
+
+
+class Fixtures:
+    """Objects the cases work on, built once"""
+
+    async def build(self):
+        await create_tables()
+        self.user_id = uuid.uuid4()
+        now = datetime.utcnow()
+        async with engine.begin() as conn:
+            await conn.execute(insert(UserModel).values(
+                id=self.user_id,
+                username="micro",
+                email="micro@example.com",
+                password_hash="x",
+                is_active=True,
+                created_at=now
+            ))
+            self.todo_ids = [uuid.uuid4() for _ in range(SEEDED_TODOS)]
+            await conn.execute(insert(TodoModel), [
+                {
+                    "id": todo_id,
+                    "user_id": self.user_id,
+                    "title": f"todo {i}",
+                    "description": "a todo used by the microbenchmarks",
+                    "completed": i % 3 == 0,
+                    "created_at": now + timedelta(seconds=i),
+                    "completed_at": now if i % 3 == 0 else None
+                }
+                for i, todo_id in enumerate(self.todo_ids)
+            ])
+
+        async with AsyncSessionLocal() as session:
+            self.todo_model = await session.get(TodoModel, self.todo_ids[0])
+            self.user = await UserRepositoryImpl(session).get_by_id(str(self.user_id))
+        self.todo_repo = TodoRepositoryImpl(None)
+        self.todo = self.todo_repo._model_to_entity(self.todo_model)
+
+        self.jwt = JWTHandler()
+        self.jwt_uncached = JWTHandler()
+        self.jwt_uncached.token_cache = TTLLRUCache(max_entries=0, ttl_seconds=60)
+        self.token = self.jwt.create_access_token(str(self.user_id), "micro@example.com")
+        self.jwt.verify_token(self.token)
+
+
+def build_cases(f: Fixtures) -> dict:
+    """name -> (callable, is_async)"""
+
+    async def read_todo_service_dependency():
+        sessions = dependencies.get_user_read_session(str(f.user_id))
+        session = await sessions.__anext__()
+        await dependencies.get_read_todo_service(session)
+        await sessions.aclose()
+
+    async def todo_service_dependency():
+        sessions = get_session()
+        session = await sessions.__anext__()
+        services = dependencies.get_todo_service(session, str(f.user_id))
+        await services.__anext__()
+        await services.aclose()
+        await sessions.aclose()
+
+    async def user_service_dependency():
+        sessions = get_session()
+        session = await sessions.__anext__()
+        await dependencies.get_user_service(session)
+        await sessions.aclose()
+
+    async def repo_get_by_id():
+        async with AsyncSessionLocal() as session:
+            await TodoRepositoryImpl(session).get_by_id(str(f.todo_ids[500]))
+
+    async def repo_get_page_rows_50():
+        async with AsyncSessionLocal() as session:
+            await TodoRepositoryImpl(session).get_page_rows_by_user_id(str(f.user_id), 51)
+
+    return {
+        "mapping.todo_model_to_entity": (lambda: f.todo_repo._model_to_entity(f.todo_model), False),
+        "mapping.todo_response_from_entity": (lambda: TodoResponse.from_entity(f.todo), False),
+        "mapping.user_response_from_entity": (lambda: UserResponse.from_entity(f.user), False),
+        "jwt.create_access_token": (lambda: f.jwt.create_access_token(str(f.user_id), "micro@example.com"), False),
+        "jwt.verify_token_cached": (lambda: f.jwt.verify_token(f.token), False),
+        "jwt.verify_token_uncached": (lambda: f.jwt_uncached.verify_token(f.token), False),
+        "dependencies.get_read_todo_service": (read_todo_service_dependency, True),
+        "dependencies.get_todo_service": (todo_service_dependency, True),
+        "dependencies.get_user_service": (user_service_dependency, True),
+        "repo.todo_get_by_id": (repo_get_by_id, True),
+        "repo.todo_get_page_rows_50": (repo_get_page_rows_50, True),
+    }
+
+
+async def call(fn, is_async: bool):
+    result = fn()
+    if is_async:
+        result = await result
+    return result
+
+
+async def time_calls(fn, is_async: bool, iterations: int) -> float:
+    started = time.perf_counter()
+    if is_async:
+        for _ in range(iterations):
+            await fn()
+    else:
+        for _ in range(iterations):
+            fn()
+    return time.perf_counter() - started
+
+
+async def measure(fn, is_async: bool, target_seconds: float, repeat: int) -> dict:
+    # Calibrate so each timed run lasts about target_seconds
+    iterations = 1
+    while True:
+        elapsed = await time_calls(fn, is_async, iterations)
+        if elapsed >= target_seconds / 10:
+            break
+        iterations *= 2
+    iterations = max(1, int(iterations * target_seconds / elapsed))
+    best = min([await time_calls(fn, is_async, iterations) for _ in range(repeat)])
+
+    # Allocations are measured separately; tracing slows calls down a lot
+    samples = 50
+    peak_bytes = retained_bytes = retained_blocks = 0
+    kept = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            before, _ = tracemalloc.get_traced_memory()
+            blocks_before = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+            kept.append(await call(fn, is_async))
+            current, peak = tracemalloc.get_traced_memory()
+            retained_blocks += sys.getallocatedblocks() - blocks_before
+            peak_bytes += peak - before
+            retained_bytes += current - before
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": round(iterations / best, 1),
+        "us_per_op": round(best / iterations * 1e6, 3),
+        "alloc_peak_bytes_per_call": round(peak_bytes / samples),
+        "alloc_retained_bytes_per_call": round(retained_bytes / samples),
+        "alloc_retained_blocks_per_call": round(retained_blocks / samples, 1),
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(baseline: dict, results: dict) -> dict:
+    """Per-case change from a baseline run; positive ops change is faster"""
+    def change(before, after):
+        return round((after - before) / before * 100, 1) if before else None
+
+    diff = {}
+    for name, after in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        diff[name] = {
+            "ops_per_sec": {"before": before["ops_per_sec"], "after": after["ops_per_sec"],
+                            "change_pct": change(before["ops_per_sec"], after["ops_per_sec"])},
+            "alloc_peak_bytes_per_call": {"before": before["alloc_peak_bytes_per_call"],
+                                          "after": after["alloc_peak_bytes_per_call"],
+                                          "change_pct": change(before["alloc_peak_bytes_per_call"],
+                                                               after["alloc_peak_bytes_per_call"])},
+        }
+    return diff
+
+
+async def main(args) -> int:
+    fixtures = Fixtures()
+    try:
+        await fixtures.build()
+        cases = build_cases(fixtures)
+        results = {}
+        for name, (fn, is_async) in cases.items():
+            if args.k and args.k not in name:
+                continue
+            results[name] = await measure(fn, is_async, args.target_seconds, args.repeat)
+    finally:
+        await engine.dispose()
+
+    report = {
+        "commit": git_commit(),
+        "python": sys.version.split()[0],
+        "database": "sqlite :memory:",
+        "results": results,
+    }
+    exit_code = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        report["baseline"] = baseline.get("commit")
+        report["diff"] = compare(baseline, results)
+        if args.fail_above is not None:
+            regressed = [
+                name for name, diff in report["diff"].items()
+                if diff["ops_per_sec"]["change_pct"] is not None and diff["ops_per_sec"]["change_pct"] < -args.fail_above
+            ]
+            report["regressed"] = regressed
+            exit_code = 1 if regressed else 0
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(os.path.join(BASELINE_DIR, f"{args.save}.json"), "w") as f:
+            f.write(output + "\n")
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks for mapping, DTO, JWT and dependency hot paths")
+    parser.add_argument("-k", help="Only run cases whose name contains this")
+    parser.add_argument("--target-seconds", type=float, default=0.2, help="Approximate length of each timed run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", metavar="NAME", help="Save the results as benchmarks/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="Diff the results against a saved baseline")
+    parser.add_argument("--fail-above", type=float, metavar="PCT",
+                        help="With --compare, exit 1 if any case lost more than PCT%% ops/sec")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latency of GET /api/todos pages at increasing scroll depth.
+
+Seeds one user with many todos in the configured database, then times
+fetching a page at several depths with the keyset query used by the API
+and, for comparison, with a plain OFFSET query. Keyset p99 should stay
+flat across depths while OFFSET grows linearly.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.pagination_depth --todos 50000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, insert, delete
+
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl, _TODO_COLUMNS
+
+
+async def seed(todo_count: int) -> uuid.UUID:
+    """Create a throwaway user with `todo_count` todos and return its id"""
+    user_id = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(days=365)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(
+            id=user_id,
+            username=f"bench-{user_id.hex[:12]}",
+            email=f"bench-{user_id.hex[:12]}@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=datetime.utcnow()
+        ))
+        batch = []
+        for i in range(todo_count):
+            batch.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": f"todo {i}",
+                "description": "",
+                "completed": False,
+                "created_at": start + timedelta(seconds=i),
+                "completed_at": None
+            })
+            if len(batch) == 5000:
+                await conn.execute(insert(TodoModel), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(TodoModel), batch)
+    return user_id
+
+
+async def cleanup(user_id: uuid.UUID):
+    async with engine.begin() as conn:
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id == user_id))
+        await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+async def key_at(user_id: uuid.UUID, offset: int):
+    """(created_at, id) of the row just before `offset`, i.e. the cursor a client would hold"""
+    async with AsyncSessionLocal() as session:
+        query = (
+            select(TodoModel.created_at, TodoModel.id)
+            .where(TodoModel.user_id == user_id)
+            .order_by(TodoModel.created_at, TodoModel.id)
+            .offset(offset - 1)
+            .limit(1)
+        )
+        row = (await session.execute(query)).one()
+        return row.created_at, str(row.id)
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3),
+    }
+
+
+async def time_keyset(user_id: uuid.UUID, page_size: int, after, samples: int):
+    timings = []
+    async with AsyncSessionLocal() as session:
+        repo = TodoRepositoryImpl(session)
+        await repo.get_page_rows_by_user_id(str(user_id), page_size + 1, after)  # warm up
+        for _ in range(samples):
+            session.expunge_all()
+            started = time.perf_counter()
+            await repo.get_page_rows_by_user_id(str(user_id), page_size + 1, after)
+            timings.append(time.perf_counter() - started)
+    return summarize(timings)
+
+
+async def time_offset(user_id: uuid.UUID, page_size: int, offset: int, samples: int):
+    timings = []
+    async with AsyncSessionLocal() as session:
+        # Same columns as the keyset page, so only the paging strategy differs
+        query = (
+            select(*_TODO_COLUMNS)
+            .where(TodoModel.user_id == user_id)
+            .order_by(TodoModel.created_at, TodoModel.id)
+            .offset(offset)
+            .limit(page_size + 1)
+        )
+        (await session.execute(query)).all()  # warm up
+        for _ in range(samples):
+            session.expunge_all()
+            started = time.perf_counter()
+            (await session.execute(query)).all()
+            timings.append(time.perf_counter() - started)
+    return summarize(timings)
+
+
+async def main(args):
+    await create_tables()
+    user_id = await seed(args.todos)
+    try:
+        results = []
+        depth = 0
+        while depth * args.page_size < args.todos:
+            offset = depth * args.page_size
+            after = await key_at(user_id, offset) if offset else None
+            results.append({
+                "page": depth,
+                "offset": offset,
+                "keyset": await time_keyset(user_id, args.page_size, after, args.samples),
+                "offset_query": await time_offset(user_id, args.page_size, offset, args.samples),
+            })
+            depth = depth * 4 if depth else 1
+        print(json.dumps({
+            "database": engine.url.get_backend_name(),
+            "todos": args.todos,
+            "page_size": args.page_size,
+            "samples": args.samples,
+            "results": results
+        }, indent=2))
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keyset vs OFFSET page latency by depth")
+    parser.add_argument("--todos", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latency of GET /api/todos/search for a user with many todos.
+
+Seeds one user with N todos whose titles and descriptions are drawn from a
+small vocabulary, then times the first page of TodoRepositoryImpl's
+search for rare, common and multi-word queries. With the full-text index
+p99 should stay in the low milliseconds at 100k todos.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.search_latency --todos 100000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, delete
+
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+
+VERBS = ["buy", "call", "email", "fix", "plan", "review", "write", "clean", "book", "pay"]
+NOUNS = ["milk", "report", "dentist", "car", "invoice", "garden", "flight", "budget", "kitchen", "slides"]
+QUERIES = {
+    "rare": "zeppelin",
+    "common": "report",
+    "two_words": "review budget",
+    "stemmed": "paying invoices",
+}
+
+
+async def seed(todo_count: int) -> uuid.UUID:
+    """Create a throwaway user with `todo_count` todos and return its id"""
+    rng = random.Random(42)
+    user_id = uuid.uuid4()
+    start = datetime.utcnow() - timedelta(days=365)
+    async with engine.begin() as conn:
+        await conn.execute(insert(UserModel).values(
+            id=user_id,
+            username=f"bench-{user_id.hex[:12]}",
+            email=f"bench-{user_id.hex[:12]}@example.com",
+            password_hash="x",
+            is_active=True,
+            created_at=datetime.utcnow()
+        ))
+        batch = []
+        for i in range(todo_count):
+            # One todo in ten thousand mentions the rare word
+            extra = " zeppelin" if i % 10000 == 0 else ""
+            batch.append({
+                "id": uuid.uuid4(),
+                "user_id": user_id,
+                "title": f"{rng.choice(VERBS)} {rng.choice(NOUNS)}{extra}",
+                "description": " ".join(rng.choice(VERBS + NOUNS) for _ in range(8)),
+                "completed": False,
+                "created_at": start + timedelta(seconds=i),
+                "completed_at": None
+            })
+            if len(batch) == 5000:
+                await conn.execute(insert(TodoModel), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(TodoModel), batch)
+    return user_id
+
+
+async def cleanup(user_id: uuid.UUID):
+    async with engine.begin() as conn:
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id == user_id))
+        await conn.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 3),
+    }
+
+
+async def time_search(user_id: uuid.UUID, query: str, page_size: int, samples: int):
+    timings = []
+    async with AsyncSessionLocal() as session:
+        repo = TodoRepositoryImpl(session)
+        hits = await repo.search_by_user_id(str(user_id), query, page_size + 1)  # warm up
+        for _ in range(samples):
+            session.expunge_all()
+            started = time.perf_counter()
+            await repo.search_by_user_id(str(user_id), query, page_size + 1)
+            timings.append(time.perf_counter() - started)
+    return {"hits_on_first_page": len(hits), **summarize(timings)}
+
+
+async def main(args):
+    await create_tables()
+    user_id = await seed(args.todos)
+    try:
+        results = {}
+        for name, query in QUERIES.items():
+            results[name] = {"q": query, **await time_search(user_id, query, args.page_size, args.samples)}
+        print(json.dumps({
+            "database": engine.url.get_backend_name(),
+            "todos": args.todos,
+            "page_size": args.page_size,
+            "samples": args.samples,
+            "results": results
+        }, indent=2))
+    finally:
+        await cleanup(user_id)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Full-text search latency for one user's todos")
+    parser.add_argument("--todos", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
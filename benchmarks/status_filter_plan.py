@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Query-plan check: ?status= list pages are served by the partial indexes.
+
+Seeds a few users, each with one in four todos completed (ids come from a
+fixed --seed, so runs are repeatable), runs ANALYZE,
+then EXPLAINs the exact statements TodoRepositoryImpl builds for the list
+endpoint (first page, a later page, and a created_after/created_before
+range) and checks that each plan uses the partial index for its status.
+Exits non-zero if any plan does not.
+
+Usage:
+    DATABASE_URL=... python -m benchmarks.status_filter_plan --todos 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, insert, delete, text
+
+from src.infrastructure.database.connection import engine, AsyncSessionLocal, create_tables
+from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl, _TODO_COLUMNS
+
+USERS = 4
+EXPECTED_INDEX = {
+    True: "ix_todos_user_id_created_at_id_completed",
+    False: "ix_todos_user_id_created_at_id_pending",
+}
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+async def seed(todo_count: int, rng: random.Random):
+    """
+    Create throwaway users sharing `todo_count` todos round-robin, with one
+    in four of each user's todos completed
+    """
+    user_ids = [_uuid(rng) for _ in range(USERS)]
+    start = datetime.utcnow() - timedelta(days=365)
+    async with engine.begin() as conn:
+        for user_id in user_ids:
+            await conn.execute(insert(UserModel).values(
+                id=user_id,
+                username=f"bench-{user_id.hex[:12]}",
+                email=f"bench-{user_id.hex[:12]}@example.com",
+                password_hash="x",
+                is_active=True,
+                created_at=datetime.utcnow()
+            ))
+        batch = []
+        for i in range(todo_count):
+            # i % USERS picks the user, so step through each user's own todos
+            completed = (i // USERS) % 4 == 0
+            created_at = start + timedelta(seconds=i)
+            batch.append({
+                "id": _uuid(rng),
+                "user_id": user_ids[i % USERS],
+                "title": f"todo {i}",
+                "description": "",
+                "completed": completed,
+                "created_at": created_at,
+                "completed_at": created_at if completed else None
+            })
+            if len(batch) == 5000:
+                await conn.execute(insert(TodoModel), batch)
+                batch = []
+        if batch:
+            await conn.execute(insert(TodoModel), batch)
+        await conn.execute(text("ANALYZE"))
+    return user_ids, start
+
+
+async def cleanup(user_ids):
+    async with engine.begin() as conn:
+        await conn.execute(delete(TodoModel).where(TodoModel.user_id.in_(user_ids)))
+        await conn.execute(delete(UserModel).where(UserModel.id.in_(user_ids)))
+
+
+async def explain(statement) -> str:
+    async with AsyncSessionLocal() as session:
+        connection = await session.connection()
+        prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN "
+        sql = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(prefix + str(sql)))
+        # SQLite rows are (id, parent, notused, detail); PostgreSQL rows are one line each
+        return "\n".join(str(row[-1]) for row in result.all())
+
+
+async def main(args):
+    await create_tables()
+    rng = random.Random(args.seed)
+    user_ids, start = await seed(args.todos, rng)
+    try:
+        repo = TodoRepositoryImpl(None)
+        user_id = str(user_ids[0])
+        middle = start + timedelta(seconds=args.todos // 2)
+        cases = {
+            "first_page": dict(after=None),
+            "later_page": dict(after=(middle, str(_uuid(rng)))),
+            "created_range": dict(after=None, created_after=start + timedelta(days=1), created_before=middle),
+        }
+        
+        results = []
+        ok = True
+        for completed, index_name in EXPECTED_INDEX.items():
+            for case, kwargs in cases.items():
+                statement = repo._page_query(select(*_TODO_COLUMNS), user_id, args.page_size + 1, completed=completed, **kwargs)
+                plan = await explain(statement)
+                uses_index = index_name in plan
+                ok = ok and uses_index
+                results.append({
+                    "status": "completed" if completed else "pending",
+                    "case": case,
+                    "expected_index": index_name,
+                    "uses_index": uses_index,
+                    "plan": plan.splitlines()
+                })
+        print(json.dumps({
+            "database": engine.url.get_backend_name(),
+            "todos": args.todos,
+            "ok": ok,
+            "results": results
+        }, indent=2))
+    finally:
+        await cleanup(user_ids)
+        await engine.dispose()
+    
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that status filters use the partial indexes")
+    parser.add_argument("--todos", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=16)
+    asyncio.run(main(parser.parse_args()))
@@ -4,6 +4,7 @@ from src.infrastructure.database.connection import engine, Base
 # Import models so they're registered with Base
 from src.infrastructure.database.models.user_model import UserModel
 from src.infrastructure.database.models.todo_model import TodoModel
+from src.infrastructure.database.models.todo_counter_model import TodoCounterModel
 
 async def create_tables():
     print("Dropping existing tables...")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Import todos for one user from an NDJSON or CSV file.
+
+Usage:
+    python import_todos.py --email someone@example.com todos.csv --format csv
+    python import_todos.py --user-id <uuid> todos.ndjson --resume-from-line 50001
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import AsyncSessionLocal, close_engine
+from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+from src.infrastructure.database.repo.user_repository_impl import UserRepositoryImpl
+from src.infrastructure.database.repo.todo_counter_repository_impl import TodoCounterRepositoryImpl
+from src.application.services.todo_service import TodoService
+from src.application.services.todo_import_parser import IMPORT_FORMATS
+
+READ_SIZE = 1024 * 1024
+
+
+async def read_file(path: str):
+    """Yield the file in fixed-size byte chunks"""
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(READ_SIZE)
+            if not data:
+                break
+            yield data
+
+
+async def import_todos(args) -> int:
+    try:
+        async with AsyncSessionLocal() as session:
+            user_repo = UserRepositoryImpl(session)
+            user_id = args.user_id
+            if args.email:
+                user = await user_repo.get_by_email(args.email)
+                if not user:
+                    print(f"❌ No user with email {args.email}")
+                    return 1
+                user_id = user.id
+
+            todo_service = TodoService(
+                TodoRepositoryImpl(session),
+                user_repo,
+                counter_repo=TodoCounterRepositoryImpl(session)
+            )
+            report = await todo_service.import_todos(
+                user_id,
+                read_file(args.file),
+                args.format,
+                args.chunk_size,
+                resume_from_line=args.resume_from_line,
+                max_errors_per_chunk=settings.todos_import_max_errors_per_chunk,
+                max_record_bytes=settings.todos_import_max_record_bytes
+            )
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        await close_engine()
+
+    print(json.dumps(report.model_dump(), indent=2))
+    if not report.completed:
+        print(f"⚠️ Import stopped; rerun with --resume-from-line {report.resume_from_line}")
+        return 1
+    print(f"✅ Imported {report.imported} todos ({report.rejected} rejected)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import todos for one user from an NDJSON or CSV file")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--email", help="Email of the user to import into")
+    target.add_argument("--user-id", help="ID of the user to import into")
+    parser.add_argument("file", help="Path to the NDJSON or CSV file")
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None,
+                        help="Input format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=settings.todos_import_chunk_size)
+    parser.add_argument("--resume-from-line", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.format is None:
+        args.format = "csv" if args.file.lower().endswith(".csv") else "ndjson"
+
+    sys.exit(asyncio.run(import_todos(args)))
+
+
+if __name__ == "__main__":
+    main()
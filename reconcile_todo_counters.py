@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Repair drift in the todo_counters table by recounting every user's todos.
+
+Safe to run while the app is serving traffic; run it from cron, e.g. nightly.
+
+Usage:
+    python reconcile_todo_counters.py [--batch-size 1000]
+"""
+import argparse
+import asyncio
+
+from src.infrastructure.database.connection import AsyncSessionLocal, close_engine
+from src.infrastructure.database.repo.todo_counter_repository_impl import TodoCounterRepositoryImpl
+
+
+async def reconcile_todo_counters(batch_size: int):
+    try:
+        async with AsyncSessionLocal() as session:
+            repaired = await TodoCounterRepositoryImpl(session).reconcile(batch_size)
+    finally:
+        await close_engine()
+    print(f"✅ Reconciled todo counters, {repaired} repaired")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recount todos and repair drifted todo_counters rows")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(reconcile_todo_counters(args.batch_size))
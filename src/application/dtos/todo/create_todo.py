@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 class CreateTodoRequest(BaseModel):
-    title: str
-    description: Optional[str] = None
-    user_id: Optional[str] = None  # Will be set from JWT token
\ No newline at end of file
+    title: str = Field(max_length=200)
+    description: Optional[str] = Field(default=None, max_length=1000)
+    user_id: Optional[str] = None  # Will be set from JWT token
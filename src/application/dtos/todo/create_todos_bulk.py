@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+from src.infrastructure.config.settings import settings
+from .create_todo import CreateTodoRequest
+
+
+class CreateTodosBulkRequest(BaseModel):
+    todos: List[CreateTodoRequest] = Field(min_length=1, max_length=settings.todos_bulk_max_items)
+    user_id: Optional[str] = None  # Will be set from JWT token
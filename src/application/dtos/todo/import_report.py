@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportChunkResult(BaseModel):
+    first_line: int
+    last_line: int
+    imported: int
+    rejected: int
+    errors: List[ImportRowError] = []
+    failed: Optional[str] = None  # Set when the chunk could not be written
+
+
+class ImportReport(BaseModel):
+    imported: int
+    rejected: int
+    chunks: List[ImportChunkResult]
+    completed: bool
+    resume_from_line: Optional[int] = None  # Pass back to continue after a failed chunk
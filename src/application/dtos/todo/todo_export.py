@@ -0,0 +1,41 @@
+import csv
+import io
+from datetime import datetime
+from typing import List
+
+from .todo_page_json import encode_todo_row
+
+EXPORT_COLUMNS = ["id", "user_id", "title", "description", "completed", "created_at", "completed_at"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_export_header(export_format: str) -> bytes:
+    """Bytes that start an export file"""
+    if export_format == "csv":
+        return encode_export_chunk("csv", [EXPORT_COLUMNS])
+    return b""
+
+
+def encode_export_chunk(export_format: str, rows: List[tuple]) -> bytes:
+    """Encode rows of (id, user_id, title, description, completed, created_at, completed_at)"""
+    if export_format == "ndjson":
+        return "".join(encode_todo_row(row) + "\n" for row in rows).encode()
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+from .todo_response import TodoResponse
+
+
+class TodoPageResponse(BaseModel):
+    items: List[TodoResponse]
+    next_cursor: Optional[str] = None  # None when there are no more todos
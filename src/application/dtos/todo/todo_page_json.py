@@ -0,0 +1,32 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _datetime(value: Optional[datetime]) -> str:
+    return "null" if value is None else f'"{value.isoformat()}"'
+
+
+def encode_todo_row(row: tuple) -> str:
+    """Encode one (id, user_id, title, description, completed, created_at, completed_at) row as TodoResponse JSON"""
+    todo_id, user_id, title, description, completed, created_at, completed_at = row
+    return (
+        f'{{"id":"{todo_id}","user_id":"{user_id}","title":{_dumps(title)},'
+        f'"description":{_dumps(description or "")},"completed":{"true" if completed else "false"},'
+        f'"created_at":{_datetime(created_at)},"completed_at":{_datetime(completed_at)}}}'
+    )
+
+
+def encode_todo_page(rows: List[tuple], next_cursor: Optional[str]) -> bytes:
+    """
+    Encode rows of (id, user_id, title, description, completed, created_at,
+    completed_at) straight to the JSON of a TodoPageResponse.
+    
+    Values come from typed database columns, so they are trusted as-is and
+    no per-item model is built or validated. The output must stay
+    equivalent to TodoPageResponse(...).model_dump_json().
+    """
+    items = ",".join(encode_todo_row(row) for row in rows)
+    return f'{{"items":[{items}],"next_cursor":{_dumps(next_cursor)}}}'.encode()
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class TodoStatsResponse(BaseModel):
+    total: int
+    pending: int
+    completed: int
+    
+    @classmethod
+    def from_entity(cls, counters):
+        return cls(
+            total=counters.total,
+            pending=counters.pending,
+            completed=counters.completed
+        )
@@ -0,0 +1,127 @@
+"""
+Incremental parsers for todo import files.
+Both turn a stream of byte chunks into (line number, record) pairs,
+holding at most one record of up to `max_record_bytes` at a time.
+"""
+import csv
+import json
+from typing import AsyncIterator, List, Optional, Tuple
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+def _decode(line: bytes) -> Tuple[str, int, Optional[ValueError]]:
+    try:
+        return line.decode("utf-8", errors="strict"), len(line), None
+    except UnicodeDecodeError as e:
+        # Replacement characters never add quotes, so CSV records still line up
+        return line.decode("utf-8", errors="replace"), len(line), ValueError(f"Invalid UTF-8 at byte {e.start} of the line")
+
+
+async def iter_lines(byte_chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[Tuple[str, int, Optional[ValueError]]]:
+    """
+    Split a byte stream into decoded lines, keeping their line endings.
+    Yields (line, size in bytes, error); a line that is not valid UTF-8
+    comes with the decode error so the record it belongs to can be
+    rejected. A line longer than `max_line_bytes` is yielded once, empty
+    and with an error, and the rest of it is dropped up to its newline.
+    """
+    buffer = b""
+    skipping = False
+    async for data in byte_chunks:
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                # The end of a line already reported as too long
+                skipping = False
+            elif len(line) > max_line_bytes:
+                yield "", len(line) + 1, ValueError(f"Line longer than {max_line_bytes} bytes")
+            else:
+                yield _decode(line + b"\n")
+        if len(buffer) > max_line_bytes:
+            if not skipping:
+                yield "", len(buffer), ValueError(f"Line longer than {max_line_bytes} bytes")
+                skipping = True
+            buffer = b""
+    if buffer and not skipping:
+        yield _decode(buffer)
+
+
+async def iter_records(
+    byte_chunks: AsyncIterator[bytes],
+    import_format: str,
+    max_record_bytes: int = 64 * 1024
+) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Yield (line number, record) for every record in the stream. A record is
+    a dict for valid input, or an Exception describing why the line could
+    not be parsed so the caller can report it. Records longer than
+    `max_record_bytes` are rejected and parsing picks up at the next line.
+    """
+    if import_format == "ndjson":
+        line_number = 0
+        async for line, _, error in iter_lines(byte_chunks, max_record_bytes):
+            line_number += 1
+            if error is not None:
+                yield line_number, error
+                continue
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("Expected a JSON object")
+                yield line_number, record
+            except ValueError as e:
+                yield line_number, e
+        return
+    
+    # CSV: a record may span several physical lines inside a quoted field;
+    # it is complete once its quotes are balanced. Quotes are counted per
+    # line as it arrives, so a long record is never rescanned
+    header = None
+    line_number = 0
+    record_start = 0
+    pending: List[str] = []
+    pending_bytes = 0
+    pending_quotes = 0
+    pending_error = None
+    async for line, size, error in iter_lines(byte_chunks, max_record_bytes):
+        line_number += 1
+        if not pending:
+            record_start = line_number
+        pending.append(line)
+        pending_bytes += size
+        pending_quotes += line.count('"')
+        pending_error = pending_error or error
+        
+        if pending_bytes > max_record_bytes:
+            # Most likely a stray quote; drop the record and resync at the next line
+            pending, pending_bytes, pending_quotes, pending_error = [], 0, 0, None
+            yield record_start, ValueError(f"Record longer than {max_record_bytes} bytes")
+            continue
+        if pending_quotes % 2:
+            continue
+        
+        text = "".join(pending)
+        error = pending_error
+        pending, pending_bytes, pending_quotes, pending_error = [], 0, 0, None
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            if error is not None:
+                yield record_start, error
+            continue
+        if error is not None:
+            yield record_start, error
+            continue
+        if len(values) != len(header):
+            yield record_start, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+        yield record_start, dict(zip(header, values))
+    
+    if pending:
+        yield record_start, ValueError("Unterminated quoted field")
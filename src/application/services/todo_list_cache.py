@@ -0,0 +1,91 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
+from src.infrastructure.config.settings import settings
+
+
+class _UserPages:
+    """One user's cached pages for one version of their todos, least recently used first"""
+    
+    __slots__ = ("version", "pages", "bytes")
+    
+    def __init__(self, version: int):
+        self.version = version
+        self.pages: "OrderedDict[Tuple[int, Optional[str], tuple], bytes]" = OrderedDict()
+        self.bytes = 0
+
+
+class TodoListCache:
+    """
+    Per-user cache of JSON-encoded todo list pages built by
+    TodoService.get_user_todos_json.
+    
+    Each user has one entry holding the pages built for the current
+    version of their todos, so a user can only ever be served pages
+    built for them, and a version change (from any worker) makes the
+    old pages unreachable. Writes on this worker also drop the entry
+    straight away.
+    
+    Page keys include client-chosen cursors and date filters, so each
+    user keeps at most `max_pages_per_user` pages and `max_bytes_per_user`
+    bytes, dropping their own least recently used pages first; one user
+    cannot crowd everyone else out of the shared byte budget.
+    """
+    
+    def __init__(self, cache: TTLLRUCache, max_pages_per_user: int = 32, max_bytes_per_user: int = 2 * 1024 * 1024):
+        self.cache = cache
+        self.max_pages_per_user = max_pages_per_user
+        self.max_bytes_per_user = max_bytes_per_user
+    
+    def get(self, user_id: str, version: int, limit: int, cursor: Optional[str], filters: tuple = ()) -> Optional[bytes]:
+        entry = self.cache.get(user_id)
+        if entry is None or entry.version != version:
+            return None
+        key = (limit, cursor, filters)
+        page = entry.pages.get(key)
+        if page is not None:
+            entry.pages.move_to_end(key)
+        return page
+    
+    def set(self, user_id: str, version: int, limit: int, cursor: Optional[str], page: bytes, filters: tuple = ()):
+        # A page that alone exceeds the user's budget is not worth caching
+        if len(page) > self.max_bytes_per_user or self.max_pages_per_user <= 0:
+            return
+        
+        entry = self.cache.peek(user_id)
+        if entry is None or entry.version != version:
+            entry = _UserPages(version)
+        
+        key = (limit, cursor, filters)
+        previous = entry.pages.pop(key, None)
+        if previous is not None:
+            entry.bytes -= len(previous)
+        while entry.pages and (
+            len(entry.pages) >= self.max_pages_per_user
+            or entry.bytes + len(page) > self.max_bytes_per_user
+        ):
+            _, evicted = entry.pages.popitem(last=False)
+            entry.bytes -= len(evicted)
+        entry.pages[key] = page
+        entry.bytes += len(page)
+        
+        self.cache.set(user_id, entry, size=entry.bytes)
+    
+    def invalidate(self, user_id: str):
+        self.cache.invalidate(user_id)
+    
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+todo_list_cache = TodoListCache(
+    TTLLRUCache(
+        max_entries=settings.todo_list_cache_max_users,
+        ttl_seconds=settings.todo_list_cache_ttl_seconds,
+        max_bytes=settings.todo_list_cache_max_bytes,
+        policy=settings.todo_list_cache_policy
+    ),
+    max_pages_per_user=settings.todo_list_cache_max_pages_per_user,
+    max_bytes_per_user=settings.todo_list_cache_max_bytes_per_user
+)
@@ -1,20 +1,96 @@
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+import base64
 import uuid
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
+
+from pydantic import ValidationError
 
 from src.domain.entities.todo import Todo
 from src.domain.repo.TodoRepository import TodoRepository
 from src.domain.repo.UserRepository import UserRepository
+from src.domain.repo.TodoCounterRepository import TodoCounterRepository
+from src.domain.entities.todo_counters import TodoCounters
 from src.application.dtos.todo.create_todo import CreateTodoRequest
+from src.application.dtos.todo.create_todos_bulk import CreateTodosBulkRequest
 from src.application.dtos.todo.update_todo import UpdateTodoRequest
 from src.application.dtos.todo.todo_response import TodoResponse
+from src.application.dtos.todo.todo_page import TodoPageResponse
+from src.application.dtos.todo.todo_stats import TodoStatsResponse
+from src.application.dtos.todo.todo_page_json import encode_todo_page
+from src.application.dtos.todo.todo_export import encode_export_header, encode_export_chunk
+from src.application.dtos.todo.import_report import ImportReport, ImportChunkResult, ImportRowError
+from src.application.services.todo_import_parser import iter_records
+from src.application.services.todo_list_cache import TodoListCache
+from src.application.tracing import span, traced
+
+
+def _encode_cursor(created_at: datetime, todo_id: str) -> str:
+    """Encode the (created_at, id) key of a todo as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{todo_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor back into a (created_at, id) key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, todo_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), str(uuid.UUID(todo_id))
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def _list_filters(
+    status: Optional[str],
+    created_after: Optional[datetime],
+    created_before: Optional[datetime]
+) -> Tuple[Optional[bool], Optional[datetime], Optional[datetime]]:
+    """
+    Turn list query filters into the repository's (completed, created_after,
+    created_before); datetimes become naive UTC like the stored created_at
+    """
+    if status not in (None, "pending", "completed"):
+        raise ValueError("Invalid status")
+    completed = None if status is None else status == "completed"
+    
+    def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    
+    return completed, naive_utc(created_after), naive_utc(created_before)
+
+
+def _encode_search_cursor(rank: float, todo_id: str) -> str:
+    """Encode the (rank, id) key of a search hit as an opaque cursor"""
+    raw = f"{rank!r}|{todo_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, str]:
+    """Decode a cursor produced by _encode_search_cursor back into a (rank, id) key"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, todo_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return float(rank), str(uuid.UUID(todo_id))
+    except ValueError:
+        raise ValueError("Invalid cursor")
 
 
 class TodoService:
-    def __init__(self, todo_repo: TodoRepository, user_repo: UserRepository):
+    def __init__(
+        self,
+        todo_repo: TodoRepository,
+        user_repo: UserRepository,
+        list_cache: Optional[TodoListCache] = None,
+        counter_repo: Optional[TodoCounterRepository] = None
+    ):
         self.todo_repo = todo_repo
         self.user_repo = user_repo
+        self.list_cache = list_cache
+        self.counter_repo = counter_repo
     
+    @traced
     async def create_todo(self, request: CreateTodoRequest) -> TodoResponse:
         # Check user exists
         user = await self.user_repo.get_by_id(request.user_id)
@@ -34,18 +110,217 @@ class TodoService:
         
         # Save and return
         saved_todo = await self.todo_repo.save(todo)
+        await self._todos_changed(request.user_id, total=1)
         return TodoResponse.from_entity(saved_todo)
     
-    async def get_user_todos(self, user_id: str) -> List[TodoResponse]:
+    @traced
+    async def create_todos(self, request: CreateTodosBulkRequest) -> List[TodoResponse]:
+        # Check user exists, once for the whole batch
+        user = await self.user_repo.get_by_id(request.user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        # Create todos; created_at is spaced by a microsecond so the list
+        # endpoint returns them in the order they were submitted
+        created_at = datetime.utcnow()
+        todos = [
+            Todo(
+                id=str(uuid.uuid4()),
+                user_id=request.user_id,
+                title=item.title,
+                description=item.description or "",
+                completed=False,
+                created_at=created_at + timedelta(microseconds=i),
+                completed_at=None
+            )
+            for i, item in enumerate(request.todos)
+        ]
+        
+        # Save all in one round trip and return
+        saved_todos = await self.todo_repo.save_many(todos)
+        await self._todos_changed(request.user_id, total=len(saved_todos))
+        with span("dto.map", items=len(saved_todos)):
+            return [TodoResponse.from_entity(todo) for todo in saved_todos]
+    
+    @traced
+    async def get_todos_version(self, user_id: str) -> int:
+        """Version marker of the user's todos; changes whenever any of them does"""
+        return await self.todo_repo.get_version(user_id)
+    
+    @traced
+    async def import_todos(
+        self,
+        user_id: str,
+        byte_chunks: AsyncIterator[bytes],
+        import_format: str,
+        chunk_size: int,
+        resume_from_line: int = 1,
+        max_errors_per_chunk: int = 100,
+        max_record_bytes: int = 64 * 1024
+    ) -> ImportReport:
+        """
+        Import todos from an NDJSON or CSV byte stream.
+        
+        Records are validated with the CreateTodoRequest rules and written
+        `chunk_size` at a time, each chunk in its own transaction. Invalid
+        records, and records over `max_record_bytes`, are skipped and
+        reported with their line number. If a chunk cannot be written the
+        import stops, and the report's resume_from_line is where to start
+        again; lines before it are already stored.
+        """
+        # Check user exists
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        report = ImportReport(imported=0, rejected=0, chunks=[], completed=True)
+        chunk: List[Todo] = []
+        chunk_result = None
+        
+        async def flush() -> bool:
+            try:
+                # Version and counters move in the chunk's transaction, so each
+                # committed chunk invalidates ETags and a failed one counts nothing
+                if chunk:
+                    await self._todos_changed(user_id, total=len(chunk))
+                chunk_result.imported = await self.todo_repo.import_many(chunk)
+            except ValueError as e:
+                chunk_result.failed = str(e)
+                report.completed = False
+                report.resume_from_line = chunk_result.first_line
+            report.chunks.append(chunk_result)
+            report.imported += chunk_result.imported
+            report.rejected += chunk_result.rejected
+            chunk.clear()
+            return chunk_result.failed is None
+        
+        created_at = datetime.utcnow()
+        async for line_number, record in iter_records(byte_chunks, import_format, max_record_bytes):
+            if line_number < resume_from_line:
+                continue
+            if chunk_result is None:
+                chunk_result = ImportChunkResult(first_line=line_number, last_line=line_number, imported=0, rejected=0)
+            chunk_result.last_line = line_number
+            
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                item = CreateTodoRequest.model_validate(record)
+                chunk.append(Todo(
+                    id=str(uuid.uuid4()),
+                    user_id=user_id,
+                    title=item.title,
+                    description=item.description or "",
+                    completed=False,
+                    # Keep file order in the list endpoint
+                    created_at=created_at + timedelta(microseconds=line_number),
+                    completed_at=None
+                ))
+            except (ValidationError, ValueError) as e:
+                chunk_result.rejected += 1
+                if len(chunk_result.errors) < max_errors_per_chunk:
+                    message = e.errors()[0]["msg"] if isinstance(e, ValidationError) else str(e)
+                    chunk_result.errors.append(ImportRowError(line=line_number, error=message))
+            
+            if len(chunk) >= chunk_size:
+                ok = await flush()
+                chunk_result = None
+                if not ok:
+                    break
+        
+        if chunk_result is not None and report.completed:
+            await flush()
+        
+        return report
+    
+    @traced
+    async def search_todos(self, user_id: str, query: str, limit: int, cursor: Optional[str] = None) -> TodoPageResponse:
+        """Full-text search the user's todos, best match first, one page at a time"""
+        after = _decode_search_cursor(cursor) if cursor else None
+        
+        # Check user exists
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        # Fetch one extra hit to know whether another page follows
+        hits = await self.todo_repo.search_by_user_id(user_id, query, limit + 1, after)
+        has_more = len(hits) > limit
+        hits = hits[:limit]
+        
+        with span("dto.map", items=len(hits)):
+            return TodoPageResponse(
+                items=[TodoResponse.from_entity(todo) for todo, _ in hits],
+                next_cursor=_encode_search_cursor(hits[-1][1], hits[-1][0].id) if has_more else None
+            )
+    
+    @traced
+    async def get_user_todos_json(
+        self,
+        user_id: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        version: Optional[int] = None,
+        status: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> bytes:
+        """
+        A page of the user's todos, oldest first, already encoded as
+        TodoPageResponse JSON. Skips entities and per-item validation, and is
+        served from the list cache when the todos have not changed. Pass
+        `version` if already read to save a lookup.
+        """
+        after = _decode_cursor(cursor) if cursor else None
+        filters = _list_filters(status, created_after, created_before)
+        
+        if self.list_cache is not None:
+            if version is None:
+                version = await self.todo_repo.get_version(user_id)
+            cached_page = self.list_cache.get(user_id, version, limit, cursor, filters)
+            if cached_page is not None:
+                return cached_page
+        
         # Check user exists
         user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise ValueError("User not found")
         
-        # Get todos
-        todos = await self.todo_repo.get_by_user_id(user_id)
-        return [TodoResponse.from_entity(todo) for todo in todos]
+        # Fetch one extra row to know whether another page follows
+        rows = await self.todo_repo.get_page_rows_by_user_id(user_id, limit + 1, after, *filters)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        # Rows are (id, user_id, title, description, completed, created_at, completed_at)
+        next_cursor = _encode_cursor(rows[-1][5], str(rows[-1][0])) if has_more else None
+        with span("dto.encode_page", items=len(rows)):
+            page = encode_todo_page(rows, next_cursor)
+        
+        if self.list_cache is not None:
+            self.list_cache.set(user_id, version, limit, cursor, page, filters)
+        return page
     
+    @traced
+    async def export_user_todos(self, user_id: str, export_format: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Check the user, then return an iterator over the encoded export
+        ("ndjson" or "csv") of all their todos, one chunk at a time
+        """
+        # Check user exists before anything is streamed
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            raise ValueError("User not found")
+        
+        async def chunks():
+            header = encode_export_header(export_format)
+            if header:
+                yield header
+            async for rows in self.todo_repo.iter_rows_by_user_id(user_id, chunk_size):
+                yield encode_export_chunk(export_format, rows)
+        
+        return chunks()
+    
+    @traced
     async def get_todo(self, todo_id: str, user_id: str) -> TodoResponse:
         todo = await self.todo_repo.get_by_id(todo_id)
         if not todo:
@@ -56,49 +331,73 @@ class TodoService:
         
         return TodoResponse.from_entity(todo)
     
+    @traced
     async def update_todo(self, request: UpdateTodoRequest, user_id: str) -> TodoResponse:
-        # Get todo
-        todo = await self.todo_repo.get_by_id(request.todo_id)
-        if not todo:
-            raise ValueError("Todo not found")
+        title = request.title or None
+        if title is not None and not title.strip():
+            raise ValueError("Title cannot be empty.")
         
-        if todo.user_id != user_id:
-            raise ValueError("Not your todo")
+        if title is None and request.description is None:
+            return await self.get_todo(request.todo_id, user_id)
         
-        # Update fields
-        if request.title:
-            todo.update_title(request.title)
-        if request.description is not None:
-            todo.description = request.description
+        # Ownership and state are checked by the UPDATE itself
+        updated_todo = await self.todo_repo.update_for_user(
+            request.todo_id, user_id, title=title, description=request.description
+        )
+        if not updated_todo:
+            await self._raise_for_missed_write(request.todo_id, user_id)
+            raise ValueError("Cannot update title of a completed todo.")
         
-        # Save and return
-        updated_todo = await self.todo_repo.update(todo)
+        await self._todos_changed(user_id)
         return TodoResponse.from_entity(updated_todo)
     
+    @traced
     async def complete_todo(self, todo_id: str, user_id: str) -> TodoResponse:
-        # Get todo
-        todo = await self.todo_repo.get_by_id(todo_id)
-        if not todo:
-            raise ValueError("Todo not found")
+        # Ownership and state are checked by the UPDATE itself
+        updated_todo = await self.todo_repo.complete_for_user(todo_id, user_id, datetime.utcnow())
+        if not updated_todo:
+            await self._raise_for_missed_write(todo_id, user_id)
+            raise ValueError("Todo is already completed.")
         
-        if todo.user_id != user_id:
-            raise ValueError("Not your todo")
-        
-        # Mark complete
-        todo.mark_complete()
-        
-        # Save and return
-        updated_todo = await self.todo_repo.update(todo)
+        await self._todos_changed(user_id, completed=1)
         return TodoResponse.from_entity(updated_todo)
     
+    @traced
     async def delete_todo(self, todo_id: str, user_id: str) -> bool:
-        # Get todo
+        # Ownership is checked by the DELETE itself
+        deleted_todo = await self.todo_repo.delete_for_user(todo_id, user_id)
+        if not deleted_todo:
+            await self._raise_for_missed_write(todo_id, user_id)
+            return False
+        
+        await self._todos_changed(user_id, total=-1, completed=-1 if deleted_todo.completed else 0)
+        return True
+    
+    @traced
+    async def get_todo_stats(self, user_id: str) -> TodoStatsResponse:
+        """Total, pending and completed counts from the user's counters row"""
+        counters = await self.counter_repo.get(user_id) or TodoCounters(user_id)
+        return TodoStatsResponse.from_entity(counters)
+    
+    async def _todos_changed(self, user_id: str, total: int = 0, completed: int = 0):
+        """
+        Record a change to the user's todos in the current transaction: new
+        version, counters moved by the given deltas, cached pages dropped
+        """
+        await self.todo_repo.bump_version(user_id)
+        if self.counter_repo is not None:
+            await self.counter_repo.add(user_id, total=total, completed=completed)
+        if self.list_cache is not None:
+            self.list_cache.invalidate(user_id)
+    
+    async def _raise_for_missed_write(self, todo_id: str, user_id: str):
+        """
+        Explain why a scoped write matched no row. Only runs on the failure
+        path, so successful writes stay at a single statement.
+        """
         todo = await self.todo_repo.get_by_id(todo_id)
         if not todo:
             raise ValueError("Todo not found")
         
         if todo.user_id != user_id:
             raise ValueError("Not your todo")
-        
-        # Delete
-        return await self.todo_repo.delete(todo_id)
\ No newline at end of file
@@ -1,6 +1,5 @@
 from datetime import datetime
 import uuid
-import hashlib
 
 from src.domain.entities.user import User
 from src.domain.repo.UserRepository import UserRepository
@@ -8,16 +7,16 @@ from src.application.dtos.user.create_user import CreateUserRequest
 from src.application.dtos.user.login_user import LoginRequest
 from src.application.dtos.user.user_response import UserResponse
 from src.application.dtos.user.login_response import LoginResponse
+from src.application.tracing import traced
 from src.infrastructure.auth.jwt_handler import jwt_handler
+from src.infrastructure.auth.password_hasher import password_hasher
 
 
 class UserService:
     def __init__(self, user_repo: UserRepository):
         self.user_repo = user_repo
     
-    def _hash_password(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
-    
+    @traced
     async def create_user(self, request: CreateUserRequest) -> UserResponse:
         # Check if user already exists
         existing_user = await self.user_repo.get_by_email(request.email)
@@ -29,7 +28,7 @@ class UserService:
             id=str(uuid.uuid4()),
             username=request.username,
             email=request.email,
-            password_hash=self._hash_password(request.password),
+            password_hash=await password_hasher.hash(request.password),
             is_active=True,
             created_at=datetime.utcnow()
         )
@@ -38,6 +37,7 @@ class UserService:
         saved_user = await self.user_repo.save(user)
         return UserResponse.from_entity(saved_user)
     
+    @traced
     async def login(self, request: LoginRequest) -> LoginResponse:
         # Get user by email
         user = await self.user_repo.get_by_email(request.email)
@@ -45,13 +45,18 @@ class UserService:
             raise ValueError("Invalid email or password")
         
         # Check password
-        if user.password_hash != self._hash_password(request.password):
+        if not await password_hasher.verify(request.password, user.password_hash):
             raise ValueError("Invalid email or password")
         
         # Check if active
         if not user.is_active:
             raise ValueError("User account is deactivated")
         
+        # Upgrade legacy or outdated hashes while we have the plaintext
+        if password_hasher.needs_rehash(user.password_hash):
+            new_hash = await password_hasher.hash(request.password)
+            await self.user_repo.update_password_hash(user.id, new_hash)
+        
         # Generate JWT token
         access_token = jwt_handler.create_access_token(user.id, user.email)
         
@@ -60,6 +65,7 @@ class UserService:
             access_token=access_token
         )
     
+    @traced
     async def get_user(self, user_id: str) -> UserResponse:
         user = await self.user_repo.get_by_id(user_id)
         if not user:
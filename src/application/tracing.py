@@ -0,0 +1,135 @@
+"""
+Request tracing.
+A trace is the tree of spans timed while serving one request: stages such
+as JWT verification, dependency construction, service calls, pool
+checkout, SQL statements and serialization. Outside a trace every span is
+a no-op, so code can be instrumented unconditionally.
+"""
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from typing import Iterator, List, Optional
+
+
+class Span:
+    """One timed stage of a trace"""
+    
+    __slots__ = ("id", "parent_id", "name", "start", "end", "attributes")
+    
+    def __init__(self, span_id: int, parent_id: Optional[int], name: str, start: float, attributes: Optional[dict] = None):
+        self.id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.start = start
+        self.end: Optional[float] = None
+        self.attributes = attributes
+    
+    def set(self, key: str, value):
+        if self.attributes is None:
+            self.attributes = {}
+        self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Stands in for a span when no trace is active"""
+    
+    def set(self, key: str, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """The spans of one request; the first span is the root"""
+    
+    def __init__(self, name: str, sampled: bool, attributes: Optional[dict] = None):
+        self.trace_id = os.urandom(8).hex()
+        self.sampled = sampled
+        self.started_at = datetime.utcnow()
+        self.spans: List[Span] = []
+        self.root = self.start_span(name, None, attributes)
+    
+    def start_span(self, name: str, parent_id: Optional[int], attributes: Optional[dict] = None, start: Optional[float] = None) -> Span:
+        span = Span(len(self.spans), parent_id, name, time.perf_counter() if start is None else start, attributes)
+        self.spans.append(span)
+        return span
+    
+    @property
+    def duration(self) -> float:
+        return (self.root.end or time.perf_counter()) - self.root.start
+    
+    def to_dict(self) -> dict:
+        """JSON-ready form; span times are milliseconds from the start of the root span"""
+        origin = self.root.start
+        end_of_trace = self.root.end or time.perf_counter()
+        return {
+            "trace_id": self.trace_id,
+            "name": self.root.name,
+            "started_at": self.started_at.isoformat() + "Z",
+            "duration_ms": round(self.duration * 1000, 3),
+            "sampled": self.sampled,
+            "attributes": self.root.attributes or {},
+            "spans": [
+                {
+                    "id": span.id,
+                    "parent_id": span.parent_id,
+                    "name": span.name,
+                    "start_ms": round((span.start - origin) * 1000, 3),
+                    "duration_ms": round(((span.end or end_of_trace) - span.start) * 1000, 3),
+                    **({"attributes": span.attributes} if span.attributes else {})
+                }
+                for span in self.spans
+            ]
+        }
+
+
+# Set by TracingMiddleware for the duration of each request
+current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+current_span_id: ContextVar[Optional[int]] = ContextVar("current_span_id", default=None)
+
+
+def _parent_id(trace: Trace) -> int:
+    parent_id = current_span_id.get()
+    return trace.root.id if parent_id is None else parent_id
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator:
+    """Time the enclosed block as a child of the current span"""
+    trace = current_trace.get()
+    if trace is None:
+        yield NOOP_SPAN
+        return
+    
+    current = trace.start_span(name, _parent_id(trace), attributes or None)
+    token = current_span_id.set(current.id)
+    try:
+        yield current
+    finally:
+        current.end = time.perf_counter()
+        current_span_id.reset(token)
+
+
+def record_span(name: str, start: float, end: float, **attributes):
+    """Add an already-timed stage (perf_counter start/end) under the current span"""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.start_span(name, _parent_id(trace), attributes or None, start=start).end = end
+
+
+def traced(fn):
+    """Time each call of an async function as a span named after it"""
+    name = fn.__qualname__
+    
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if current_trace.get() is None:
+            return await fn(*args, **kwargs)
+        with span(name):
+            return await fn(*args, **kwargs)
+    
+    return wrapper
@@ -2,6 +2,9 @@ from datetime import datetime
 from typing import Optional
 
 class Todo:
+    # No per-instance __dict__; lists of thousands of todos stay compact
+    __slots__ = ("id", "user_id", "title", "description", "completed", "created_at", "completed_at")
+
     def __init__(self, id: str, user_id: str, title: str, description: str = "", completed: bool = False, created_at: Optional[datetime] = None, completed_at: Optional[datetime] = None):
         self.id = id
         self.user_id = user_id
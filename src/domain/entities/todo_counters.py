@@ -0,0 +1,11 @@
+class TodoCounters:
+    __slots__ = ("user_id", "total", "completed")
+
+    def __init__(self, user_id: str, total: int = 0, completed: int = 0):
+        self.user_id = user_id
+        self.total = total
+        self.completed = completed
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.completed
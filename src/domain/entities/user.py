@@ -2,6 +2,9 @@ from datetime import datetime
 from typing import Optional
 
 class User:
+    # No per-instance __dict__
+    __slots__ = ("id", "username", "email", "password_hash", "is_active", "created_at", "updated_at")
+
     def __init__(self, id: str, username: str, email: str, password_hash: str, is_active: bool = True, created_at: Optional[datetime] = None):
         self.id = id
         self.username = username  # Added missing username
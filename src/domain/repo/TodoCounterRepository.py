@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from ..entities.todo_counters import TodoCounters
+
+class TodoCounterRepository(ABC):
+    """
+    Abstract repository for the per-user todo counters.
+    Counters are adjusted by deltas in the same transaction as the todo
+    write they describe, and repaired from the todos themselves by reconcile.
+    """
+    
+    @abstractmethod
+    async def get(self, user_id: str) -> Optional[TodoCounters]:
+        """Get a user's counters, None if they have none yet"""
+        pass
+    
+    @abstractmethod
+    async def add(self, user_id: str, total: int = 0, completed: int = 0) -> None:
+        """Add the given deltas to a user's counters, creating them if needed"""
+        pass
+    
+    @abstractmethod
+    async def reconcile(self, batch_size: int = 1000) -> int:
+        """
+        Recount every user's todos and overwrite counters that drifted,
+        one batch of users per transaction; return how many were repaired
+        """
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Tuple
 from ..entities.todo import Todo
 
 class TodoRepository(ABC):
@@ -13,6 +14,19 @@ class TodoRepository(ABC):
         """Save a todo and return the saved todo"""
         pass
     
+    @abstractmethod
+    async def save_many(self, todos: List[Todo]) -> List[Todo]:
+        """Save several todos in one batch and return them in the same order"""
+        pass
+    
+    @abstractmethod
+    async def import_many(self, todos: List[Todo]) -> int:
+        """
+        Bulk-load todos through the fastest path the backend offers and
+        commit them as one unit; return how many were written
+        """
+        pass
+    
     @abstractmethod
     async def get_by_id(self, todo_id: str) -> Optional[Todo]:
         """Get todo by ID, return None if not found"""
@@ -23,16 +37,68 @@ class TodoRepository(ABC):
         """Get all todos for a specific user"""
         pass
     
+    @abstractmethod
+    async def get_page_rows_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        completed: Optional[bool] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> List[tuple]:
+        """
+        Get up to `limit` todos for a user ordered by (created_at, id),
+        starting after the given key, as plain rows of
+        (id, user_id, title, description, completed, created_at, completed_at).
+        Optionally keep only completed or pending todos, and those created
+        in [created_after, created_before)
+        """
+        pass
+    
+    @abstractmethod
+    async def search_by_user_id(self, user_id: str, query: str, limit: int, after: Optional[Tuple[float, str]] = None) -> List[Tuple[Todo, float]]:
+        """
+        Full-text search a user's todos by title and description. Return up
+        to `limit` (todo, rank) pairs, best match first (rank descending,
+        then id), starting after the given (rank, id) key
+        """
+        pass
+    
+    @abstractmethod
+    def iter_rows_by_user_id(self, user_id: str, chunk_size: int) -> AsyncIterator[List[tuple]]:
+        """
+        Stream all of a user's todos as chunks of at most `chunk_size` rows
+        (same columns as get_page_rows_by_user_id), oldest first, without
+        holding a database connection between chunks
+        """
+        pass
+    
     @abstractmethod
     async def update(self, todo: Todo) -> Todo:
         """Update an existing todo"""
         pass
     
+    @abstractmethod
+    async def update_for_user(self, todo_id: str, user_id: str, title: Optional[str] = None, description: Optional[str] = None) -> Optional[Todo]:
+        """Update a user's todo in one statement; changing the title also requires it to be pending. Return None if nothing matched"""
+        pass
+    
+    @abstractmethod
+    async def complete_for_user(self, todo_id: str, user_id: str, completed_at: datetime) -> Optional[Todo]:
+        """Mark a user's pending todo complete in one statement, return None if nothing matched"""
+        pass
+    
     @abstractmethod
     async def delete(self, todo_id: str) -> bool:
         """Delete todo, return True if deleted, False if not found"""
         pass
     
+    @abstractmethod
+    async def delete_for_user(self, todo_id: str, user_id: str) -> Optional[Todo]:
+        """Delete a user's todo in one statement, return the deleted todo or None if nothing matched"""
+        pass
+    
     @abstractmethod
     async def get_completed_todos(self, user_id: str) -> List[Todo]:
         """Get all completed todos for a user"""
@@ -41,4 +107,14 @@ class TodoRepository(ABC):
     @abstractmethod
     async def get_pending_todos(self, user_id: str) -> List[Todo]:
         """Get all pending todos for a user"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_version(self, user_id: str) -> int:
+        """Get the version marker of a user's todos, 0 if unknown"""
+        pass
+    
+    @abstractmethod
+    async def bump_version(self, user_id: str) -> None:
+        """Advance the version marker of a user's todos after a change"""
+        pass
@@ -23,6 +23,11 @@ class UserRepository(ABC):
         """Get user by email, return None if not found"""
         pass
     
+    @abstractmethod
+    async def update_password_hash(self, user_id: str, password_hash: str) -> bool:
+        """Replace a user's password hash, return True if updated, False if not found"""
+        pass
+    
     @abstractmethod
     async def delete(self, user_id: str) -> bool:
         """Delete user, return True if deleted, False if not found"""
@@ -1,7 +1,10 @@
 from datetime import datetime, timedelta
+import hashlib
+import time
 from typing import Optional
 from jose import JWTError, jwt
 from src.infrastructure.config.settings import settings
+from src.infrastructure.cache.ttl_lru_cache import TTLLRUCache
 
 
 class JWTHandler:
@@ -9,6 +12,11 @@ class JWTHandler:
         self.secret_key = settings.jwt_secret_key
         self.algorithm = settings.jwt_algorithm
         self.expires_delta = timedelta(minutes=settings.jwt_access_token_expire_minutes)
+        # Decoded payloads of already verified tokens, keyed by token hash
+        self.token_cache = TTLLRUCache(
+            max_entries=settings.jwt_cache_max_entries,
+            ttl_seconds=self.expires_delta.total_seconds()
+        )
     
     def create_access_token(self, user_id: str, email: str) -> str:
         """Create JWT access token"""
@@ -22,15 +30,28 @@ class JWTHandler:
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
     
     def verify_token(self, token: str) -> Optional[dict]:
-        """Verify and decode JWT token"""
+        """Verify and decode JWT token, reusing the result for tokens seen before"""
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload = self.token_cache.get(cache_key)
+        if payload is not None:
+            return dict(payload)
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
             user_id = payload.get("sub")
             if user_id is None:
                 return None
-            return payload
         except JWTError:
             return None
+        
+        # Only cache tokens that expire, and never past their exp claim
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            remaining = min(expires_at - time.time(), self.token_cache.ttl_seconds)
+            if remaining > 0:
+                self.token_cache.set(cache_key, dict(payload), ttl_seconds=remaining)
+        
+        return payload
 
 
 jwt_handler = JWTHandler()
@@ -0,0 +1,93 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from src.infrastructure.config.settings import settings
+from src.application.tracing import traced
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when too many hash operations are already waiting for the pool"""
+    pass
+
+
+class PasswordHasher:
+    """
+    scrypt password hashing run on a dedicated, bounded thread pool so a
+    burst of logins cannot block the event loop. hashlib.scrypt releases
+    the GIL, so the worker threads run in parallel with request handling.
+    
+    Hashes are stored as "scrypt$n$r$p$salt$hash". Unsalted SHA-256 hex
+    digests written by earlier versions are still accepted by verify()
+    and flagged by needs_rehash().
+    """
+    
+    def __init__(self):
+        self.n = settings.password_scrypt_n
+        self.r = settings.password_scrypt_r
+        self.p = settings.password_scrypt_p
+        self.max_pending = settings.password_hash_max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            thread_name_prefix="password-hasher"
+        )
+        self._pending = 0
+    
+    @traced
+    async def hash(self, password: str) -> str:
+        """Hash a password with a fresh salt"""
+        salt = os.urandom(16)
+        derived = await self._run(self._scrypt, password, salt, self.n, self.r, self.p)
+        return "$".join([
+            "scrypt", str(self.n), str(self.r), str(self.p),
+            base64.b64encode(salt).decode(), base64.b64encode(derived).decode()
+        ])
+    
+    @traced
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Check a password against a stored hash in constant time"""
+        if not password_hash.startswith("scrypt$"):
+            legacy = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy, password_hash)
+        
+        try:
+            _, n, r, p, salt, expected = password_hash.split("$")
+            salt = base64.b64decode(salt)
+            expected = base64.b64decode(expected)
+            n, r, p = int(n), int(r), int(p)
+        except ValueError:
+            return False
+        
+        derived = await self._run(self._scrypt, password, salt, n, r, p)
+        return hmac.compare_digest(derived, expected)
+    
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True for legacy hashes and hashes made with other scrypt parameters"""
+        return not password_hash.startswith(f"scrypt${self.n}${self.r}${self.p}$")
+    
+    def stats(self) -> dict:
+        """Pool occupancy for monitoring"""
+        return {"pending": self._pending, "max_pending": self.max_pending}
+    
+    async def _run(self, fn, *args):
+        if self._pending >= self.max_pending:
+            raise PasswordHasherBusyError("Too many concurrent password operations")
+        
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+    
+    @staticmethod
+    def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p,
+            maxmem=256 * n * r * p, dklen=32
+        )
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1 @@
+# In-process caching utilities
@@ -0,0 +1,64 @@
+import copy
+from typing import Optional
+
+from src.domain.entities.user import User
+from src.domain.repo.UserRepository import UserRepository
+from src.infrastructure.config.settings import settings
+from .ttl_lru_cache import TTLLRUCache
+
+
+class CachedUserRepository(UserRepository):
+    """
+    Read-through cache in front of another UserRepository.
+    Lookups by ID are served from an in-process cache shared by all
+    requests on the worker; writes go to the wrapped repository and
+    invalidate the cached entry.
+    """
+    
+    def __init__(self, inner: UserRepository, cache: TTLLRUCache):
+        self.inner = inner
+        self.cache = cache
+    
+    async def save(self, user: User) -> User:
+        """Save a user and return the saved user"""
+        saved_user = await self.inner.save(user)
+        self.invalidate(saved_user.id)
+        return saved_user
+    
+    async def get_by_id(self, user_id: str) -> Optional[User]:
+        """Get user by ID, from the cache when possible"""
+        cached_user = self.cache.get(user_id)
+        if cached_user is not None:
+            # Hand out copies so callers cannot mutate the shared entry
+            return copy.copy(cached_user)
+        
+        user = await self.inner.get_by_id(user_id)
+        if user:
+            self.cache.set(user_id, copy.copy(user))
+        return user
+    
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email; not cached since login needs the current password hash"""
+        return await self.inner.get_by_email(email)
+    
+    async def update_password_hash(self, user_id: str, password_hash: str) -> bool:
+        """Replace a user's password hash and drop it from the cache"""
+        updated = await self.inner.update_password_hash(user_id, password_hash)
+        self.invalidate(user_id)
+        return updated
+    
+    async def delete(self, user_id: str) -> bool:
+        """Delete user and drop it from the cache"""
+        deleted = await self.inner.delete(user_id)
+        self.invalidate(user_id)
+        return deleted
+    
+    def invalidate(self, user_id: str):
+        """Forget a cached user, e.g. after it was deactivated"""
+        self.cache.invalidate(user_id)
+
+
+user_cache = TTLLRUCache(
+    max_entries=settings.user_cache_max_entries,
+    ttl_seconds=settings.user_cache_ttl_seconds
+)
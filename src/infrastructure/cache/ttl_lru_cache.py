@@ -0,0 +1,108 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLLRUCache:
+    """
+    Bounded in-process cache with a per-entry time to live. Meant to be
+    shared by the coroutines of one worker; every operation completes
+    without awaiting, so no lock is needed.
+    
+    Entries are bounded by count and, optionally, by the sum of the sizes
+    given to set(). When full, the least recently used entry is evicted
+    ("lru"), or the oldest inserted one ("fifo").
+    """
+    
+    POLICIES = ("lru", "fifo")
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: Optional[int] = None, policy: str = "lru"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        value, expires_at, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        if self.policy == "lru":
+            self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Like get(), but without touching counters or recency"""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+    
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None, size: int = 0):
+        """Store a value, evicting entries until the cache is within its bounds"""
+        if self.max_entries <= 0:
+            return
+        
+        self._remove(key)
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self._bytes += size
+        
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+    
+    def invalidate(self, key: Hashable):
+        """Drop a single entry if present"""
+        self._remove(key)
+    
+    def clear(self):
+        """Drop every entry"""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def stats(self) -> dict:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        stats = {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+        if self.max_bytes is not None:
+            stats.update(bytes=self._bytes, max_bytes=self.max_bytes, policy=self.policy)
+        return stats
+    
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
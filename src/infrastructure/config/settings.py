@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -12,10 +13,50 @@ class Settings(BaseSettings):
     database_user: str = Field(default="postgres")
     database_password: str = Field(default="soap")
     
+    # Read replica (reads use the primary when unset)
+    database_read_url: Optional[str] = Field(default=None)
+    read_your_writes_seconds: float = Field(default=5)
+    read_your_writes_max_users: int = Field(default=100000)
+    
+    # Connection pool
+    db_pool_size: int = Field(default=5)
+    db_max_overflow: int = Field(default=10)
+    db_pool_timeout: float = Field(default=30)
+    db_pool_recycle: int = Field(default=1800)  # seconds, -1 disables
+    db_pool_pre_ping: bool = Field(default=True)
+    db_statement_cache_size: int = Field(default=100)  # asyncpg only; 0 behind PgBouncer
+    
     # JWT
     jwt_secret_key: str = Field(default="fallback-secret-key")
     jwt_algorithm: str = Field(default="HS256")
     jwt_access_token_expire_minutes: int = Field(default=30)
+    jwt_cache_max_entries: int = Field(default=10000)
+    
+    # Password hashing
+    password_scrypt_n: int = Field(default=2 ** 14)
+    password_scrypt_r: int = Field(default=8)
+    password_scrypt_p: int = Field(default=1)
+    password_hash_workers: int = Field(default=2)
+    password_hash_max_pending: int = Field(default=64)
+    
+    # Caching (a max of 0 entries/users disables that cache)
+    user_cache_max_entries: int = Field(default=10000)
+    user_cache_ttl_seconds: float = Field(default=60)
+    todo_list_cache_max_users: int = Field(default=10000)
+    todo_list_cache_max_bytes: int = Field(default=64 * 1024 * 1024)
+    todo_list_cache_ttl_seconds: float = Field(default=300)
+    todo_list_cache_policy: str = Field(default="lru")  # "lru" or "fifo"
+    todo_list_cache_max_pages_per_user: int = Field(default=32)
+    todo_list_cache_max_bytes_per_user: int = Field(default=2 * 1024 * 1024)
+    
+    # Pagination
+    todos_page_default_limit: int = Field(default=50)
+    todos_page_max_limit: int = Field(default=200)
+    todos_bulk_max_items: int = Field(default=1000)
+    todos_export_chunk_size: int = Field(default=1000)
+    todos_import_chunk_size: int = Field(default=5000)
+    todos_import_max_errors_per_chunk: int = Field(default=100)
+    todos_import_max_record_bytes: int = Field(default=64 * 1024)
     
     # App
     app_name: str = Field(default="Todo App")
@@ -23,6 +64,31 @@ class Settings(BaseSettings):
     app_host: str = Field(default="0.0.0.0")
     app_port: int = Field(default=int(os.getenv("PORT", 8000)))
     debug: bool = Field(default=False)
+    # Record request metrics and serve them at /metrics
+    metrics_enabled: bool = Field(default=True)
+    # SQL profiling: per-statement metrics, per-request totals (as response
+    # headers in debug) and a log of statements slower than the threshold,
+    # of which a sample_rate fraction is printed
+    sql_profiler_enabled: bool = Field(default=True)
+    slow_query_threshold_ms: float = Field(default=200)
+    slow_query_sample_rate: float = Field(default=1.0)
+    # Tracing: each request's stages are timed as spans, and the trace is
+    # written to a rotating JSON-lines file when the request was head
+    # sampled or took longer than the slow threshold
+    tracing_enabled: bool = Field(default=True)
+    tracing_sample_rate: float = Field(default=0.01)
+    tracing_slow_request_ms: float = Field(default=500)
+    tracing_file: str = Field(default="traces/traces.jsonl")
+    tracing_file_max_bytes: int = Field(default=10 * 1024 * 1024)
+    tracing_file_backup_count: int = Field(default=5)
+    
+    # Admin endpoints (/api/admin/...) are open to users with these
+    # comma-separated ids; none by default
+    admin_user_ids: str = Field(default="")
+    # Longest CPU profile an admin can request
+    profiler_max_seconds: float = Field(default=60)
+    # tracemalloc snapshots kept per worker for diffing
+    memory_snapshots_max: int = Field(default=5)
     
     class Config:
         env_file = ".env"
@@ -1,18 +1,92 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
 from ..config.settings import settings
+from .pool_metrics import InstrumentedAsyncQueuePool
+from .query_profiler import instrument_engine
+from src.application.tracing import span
+
+
+def _engine_options(database_url: str) -> dict:
+    """Pool and driver options from settings for the given database URL"""
+    url = make_url(database_url)
+    options = {"echo": settings.debug, "future": True}
+    
+    # In-memory SQLite needs its single static connection, leave it alone
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+    
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"statement_cache_size": settings.db_statement_cache_size}
+    return options
+
 
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True
+engine = create_async_engine(settings.database_url, **_engine_options(settings.database_url))
+
+# Engine for read-only work; the primary itself when no replica is configured
+read_engine = (
+    create_async_engine(settings.database_read_url, **_engine_options(settings.database_read_url))
+    if settings.database_read_url
+    else engine
 )
 
-# Create session factory
+if settings.sql_profiler_enabled:
+    instrument_engine(engine.sync_engine)
+    if read_engine is not engine:
+        instrument_engine(read_engine.sync_engine)
+
+
+class WriteTrackingSession(Session):
+    """Session that records in info["has_writes"] whether it has written since the last commit"""
+    pass
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_statement_writes(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _track_flush_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_commit")
+@event.listens_for(WriteTrackingSession, "after_rollback")
+def _reset_writes(session):
+    session.info.pop("has_writes", None)
+
+
+# Create session factories
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=WriteTrackingSession,
+    expire_on_commit=False
+)
+
+# Read sessions run in autocommit: no BEGIN before the first query and no
+# COMMIT at the end, so a read costs exactly its SELECTs. As with any
+# session, no connection is checked out until the first query.
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+AsyncPrimaryReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
     expire_on_commit=False
 )
 
@@ -29,7 +103,10 @@ async def get_session() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            # Only pay for a COMMIT when the request actually wrote something
+            if session.info.get("has_writes") or session.new or session.dirty or session.deleted:
+                with span("db.commit"):
+                    await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -37,6 +114,16 @@ async def get_session() -> AsyncSession:
             await session.close()
 
 
+async def get_read_session() -> AsyncSession:
+    """
+    Dependency function to get a read-only database session.
+    Served by the read replica when one is configured; runs in
+    autocommit and never commits.
+    """
+    async with AsyncReadSessionLocal() as session:
+        yield session
+
+
 # Function to create all tables
 async def create_tables():
     """Create all database tables"""
@@ -46,5 +133,7 @@ async def create_tables():
 
 # Function to close engine
 async def close_engine():
-    """Close database engine"""
-    await engine.dispose()
\ No newline at end of file
+    """Close database engines"""
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
\ No newline at end of file
@@ -7,8 +7,11 @@ from typing import Protocol
 
 from src.domain.repo.UserRepository import UserRepository
 from src.domain.repo.TodoRepository import TodoRepository
+from src.domain.repo.TodoCounterRepository import TodoCounterRepository
 from .repo.user_repository_impl import UserRepositoryImpl
 from .repo.todo_repository_impl import TodoRepositoryImpl
+from .repo.todo_counter_repository_impl import TodoCounterRepositoryImpl
+from ..cache.cached_user_repository import CachedUserRepository, user_cache
 
 
 class RepositoryContainer:
@@ -18,12 +21,13 @@ class RepositoryContainer:
         self.session = session
         self._user_repo: UserRepository = None
         self._todo_repo: TodoRepository = None
+        self._todo_counter_repo: TodoCounterRepository = None
     
     @property
     def user_repository(self) -> UserRepository:
         """Get user repository instance"""
         if self._user_repo is None:
-            self._user_repo = UserRepositoryImpl(self.session)
+            self._user_repo = CachedUserRepository(UserRepositoryImpl(self.session), user_cache)
         return self._user_repo
     
     @property
@@ -32,6 +36,13 @@ class RepositoryContainer:
         if self._todo_repo is None:
             self._todo_repo = TodoRepositoryImpl(self.session)
         return self._todo_repo
+    
+    @property
+    def todo_counter_repository(self) -> TodoCounterRepository:
+        """Get todo counter repository instance"""
+        if self._todo_counter_repo is None:
+            self._todo_counter_repo = TodoCounterRepositoryImpl(self.session)
+        return self._todo_counter_repo
 
 
 async def get_repository_container(session: AsyncSession) -> RepositoryContainer:
@@ -1,5 +1,6 @@
 from src.infrastructure.database.connection import Base
 from .user_model import UserModel
 from .todo_model import TodoModel
+from .todo_counter_model import TodoCounterModel
 
-__all__ = ["Base", "UserModel", "TodoModel"]
\ No newline at end of file
+__all__ = ["Base", "UserModel", "TodoModel", "TodoCounterModel"]
\ No newline at end of file
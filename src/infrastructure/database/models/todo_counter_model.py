@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, BigInteger, ForeignKey, Uuid
+from src.infrastructure.database.connection import Base
+
+
+class TodoCounterModel(Base):
+    """Per-user todo counts, kept in step with todos by TodoService"""
+    __tablename__ = "todo_counters"
+    
+    user_id = Column(Uuid(as_uuid=True), ForeignKey('users.id', ondelete="CASCADE"), primary_key=True)
+    total = Column(BigInteger, default=0, server_default="0", nullable=False)
+    completed = Column(BigInteger, default=0, server_default="0", nullable=False)
+    updated_at = Column(DateTime, nullable=False)
@@ -1,16 +1,95 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Index, Uuid, DDL, event
 from src.infrastructure.database.connection import Base
 import uuid
 
 
 class TodoModel(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        # Backs keyset pagination of a user's todos ordered by (created_at, id)
+        Index("ix_todos_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid(as_uuid=True), ForeignKey('users.id'), nullable=False)
     title = Column(String(200), nullable=False)
     description = Column(String(1000), nullable=True)
     completed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, nullable=False)
-    completed_at = Column(DateTime, nullable=True)
\ No newline at end of file
+    completed_at = Column(DateTime, nullable=True)
+
+
+# Partial indexes behind ?status= on the list endpoint: each one holds only
+# completed or only pending todos, in the same (created_at, id) order as
+# keyset pagination. Queries must filter with the same expression
+# (TodoModel.completed == True/False) for the planner to pick them.
+Index(
+    "ix_todos_user_id_created_at_id_completed",
+    TodoModel.user_id, TodoModel.created_at, TodoModel.id,
+    postgresql_where=TodoModel.completed == True,
+    sqlite_where=TodoModel.completed == True
+)
+Index(
+    "ix_todos_user_id_created_at_id_pending",
+    TodoModel.user_id, TodoModel.created_at, TodoModel.id,
+    postgresql_where=TodoModel.completed == False,
+    sqlite_where=TodoModel.completed == False
+)
+
+
+# Full-text search index over title and description. It is not mapped on
+# TodoModel because each backend stores it differently:
+# - PostgreSQL: a generated tsvector column (title weighted above
+#   description) with a GIN index
+# - SQLite: an external-content FTS5 table kept in sync by triggers
+TODO_SEARCH_DDL = {
+    "postgresql": [
+        """
+        ALTER TABLE todos ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX ix_todos_search_vector ON todos USING gin (search_vector)",
+    ],
+    "sqlite": [
+        """
+        CREATE VIRTUAL TABLE todos_fts USING fts5(
+            title, description, content='todos', content_rowid='rowid', tokenize='porter unicode61'
+        )
+        """,
+        """
+        CREATE TRIGGER todos_fts_insert AFTER INSERT ON todos BEGIN
+            INSERT INTO todos_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+        """
+        CREATE TRIGGER todos_fts_delete AFTER DELETE ON todos BEGIN
+            INSERT INTO todos_fts (todos_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        """,
+        """
+        CREATE TRIGGER todos_fts_update AFTER UPDATE OF title, description ON todos BEGIN
+            INSERT INTO todos_fts (todos_fts, rowid, title, description) VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO todos_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END
+        """,
+    ],
+}
+
+for dialect_name, statements in TODO_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(TodoModel.__table__, "after_create", DDL(statement).execute_if(dialect=dialect_name))
+
+# The triggers go with the table, the FTS5 table does not
+event.listen(TodoModel.__table__, "before_drop", DDL("DROP TABLE IF EXISTS todos_fts").execute_if(dialect="sqlite"))
+
+
+def is_search_schema_object(name: str) -> bool:
+    """
+    True for the column, index and tables made by TODO_SEARCH_DDL. They are
+    not in Base.metadata, so alembic autogenerate must skip them rather
+    than propose dropping them.
+    """
+    # todos_fts_* also covers the FTS5 shadow tables (todos_fts_data, ...)
+    return name in ("search_vector", "ix_todos_search_vector") or name.startswith("todos_fts")
@@ -1,5 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Boolean, DateTime, BigInteger, Uuid
 from src.infrastructure.database.connection import Base
 import uuid
 
@@ -7,10 +6,12 @@ import uuid
 class UserModel(Base):
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String(50), nullable=False, unique=True)
     email = Column(String(255), nullable=False, unique=True)
     password_hash = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, nullable=False)
-    updated_at = Column(DateTime, nullable=True)
\ No newline at end of file
+    updated_at = Column(DateTime, nullable=True)
+    # Bumped on every change to the user's todos; drives ETags on todo reads
+    todos_version = Column(BigInteger, default=0, server_default="0", nullable=False)
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Connection pool instrumentation.
+Counts how long requests wait to get a connection and how often they
+give up, and reports the live state of the pool.
+"""
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from src.application.tracing import record_span
+
+
+class RequestDbTiming:
+    """Per-request accumulator, filled in by the pool and read by the timing middleware"""
+    
+    def __init__(self):
+        self.pool_wait = 0.0
+        self.pool_checkouts = 0
+
+
+# Set by RequestTimingMiddleware for the duration of each request
+current_request_timing: ContextVar[Optional[RequestDbTiming]] = ContextVar("current_request_timing", default=None)
+
+
+class PoolMetrics:
+    """Process-wide pool counters"""
+    
+    def __init__(self):
+        self.acquisitions = 0
+        self.acquire_timeouts = 0
+        self.acquire_wait_total = 0.0
+        self.acquire_wait_max = 0.0
+    
+    def record_acquire(self, seconds: float):
+        self.acquisitions += 1
+        self.acquire_wait_total += seconds
+        self.acquire_wait_max = max(self.acquire_wait_max, seconds)
+        
+        timing = current_request_timing.get()
+        if timing is not None:
+            timing.pool_wait += seconds
+            timing.pool_checkouts += 1
+    
+    def snapshot(self, pool: Pool) -> dict:
+        """Counters plus the current checked-out / idle / overflow state of `pool`"""
+        state = {}
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            state = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0)
+            }
+        
+        return {
+            **state,
+            "acquisitions": self.acquisitions,
+            "acquire_timeouts": self.acquire_timeouts,
+            "acquire_wait_avg_ms": round(self.acquire_wait_total / self.acquisitions * 1000, 3) if self.acquisitions else 0.0,
+            "acquire_wait_max_ms": round(self.acquire_wait_max * 1000, 3)
+        }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports acquisition wait time and timeouts to pool_metrics"""
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.acquire_timeouts += 1
+            raise
+        finally:
+            finished = time.perf_counter()
+            pool_metrics.record_acquire(finished - started)
+            record_span("db.pool.checkout", started, finished)
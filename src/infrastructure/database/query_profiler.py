@@ -0,0 +1,148 @@
+"""
+SQL statement profiler.
+Engine event hooks time every statement and count its rows, feed the
+process metrics by route, collect per-request totals for the request
+timing middleware, flag statements a request runs more than once, and
+print a sampled log of slow statements in normalized form.
+"""
+import json
+import random
+import re
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.application.tracing import current_trace, record_span
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.prometheus import metrics_registry
+
+NO_ROUTE = "<none>"
+
+db_queries_total = metrics_registry.counter(
+    "db_queries_total", "SQL statements executed, by route template and operation", ("route", "operation")
+)
+db_query_duration_seconds = metrics_registry.histogram(
+    "db_query_duration_seconds", "Time to execute a SQL statement, by route template and operation", ("route", "operation"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+)
+db_query_rows = metrics_registry.histogram(
+    "db_query_rows", "Rows returned or affected by a SQL statement, by route template and operation", ("route", "operation"),
+    buckets=(0, 1, 10, 50, 100, 500, 1000, 5000)
+)
+db_repeated_queries_total = metrics_registry.counter(
+    "db_repeated_queries_total", "Requests that ran the same normalized statement more than once, by route template", ("route",)
+)
+
+
+class RequestQueryStats:
+    """Per-request accumulator, filled in by the engine hooks and read by the timing middleware"""
+    
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.count = 0
+        self.total_time = 0.0
+        self.statements: Dict[str, int] = {}
+    
+    @property
+    def route(self) -> str:
+        # FastAPI's router leaves the matched route in the scope before the endpoint runs
+        route = self.scope.get("route") if self.scope is not None else None
+        return getattr(route, "path", None) or NO_ROUTE
+    
+    def repeated(self) -> Dict[str, int]:
+        """Normalized statements this request ran more than once, with their counts"""
+        return {statement: count for statement, count in self.statements.items() if count > 1}
+
+
+# Set by RequestTimingMiddleware for the duration of each request
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("current_query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+", re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """Collapse a statement to its shape: literals and placeholders become ?, lists become (...)"""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _VALUES_LIST.sub(r"\1", normalized)
+
+
+def _operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+def _row_count(cursor) -> int:
+    rowcount = cursor.rowcount
+    if rowcount is not None and rowcount >= 0:
+        return rowcount
+    # SELECTs report -1; the asyncio driver adapters have already buffered
+    # their rows by the time the statement returns, so count those
+    rows = getattr(cursor, "_rows", None)
+    return len(rows) if rows is not None else 0
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    finished = time.perf_counter()
+    elapsed = finished - context._query_started
+    rows = _row_count(cursor)
+    stats = current_query_stats.get()
+    route = stats.route if stats is not None else NO_ROUTE
+    operation = _operation(statement)
+    
+    db_queries_total.inc((route, operation))
+    db_query_duration_seconds.observe((route, operation), elapsed)
+    db_query_rows.observe((route, operation), rows)
+    
+    normalized = None
+    if stats is not None:
+        normalized = normalize_statement(statement)
+        stats.count += 1
+        stats.total_time += elapsed
+        stats.statements[normalized] = stats.statements.get(normalized, 0) + 1
+    
+    if current_trace.get() is not None:
+        normalized = normalized or normalize_statement(statement)
+        record_span("db.query", context._query_started, finished, operation=operation, rows=rows, statement=normalized)
+    
+    if elapsed * 1000 >= settings.slow_query_threshold_ms and random.random() < settings.slow_query_sample_rate:
+        print("slow_query " + json.dumps({
+            "route": route,
+            "duration_ms": round(elapsed * 1000, 3),
+            "rows": rows,
+            "executemany": executemany,
+            "statement": normalized or normalize_statement(statement)
+        }))
+
+
+def report_repeated_queries(stats: RequestQueryStats) -> Dict[str, int]:
+    """Count (and in debug, print) the statements a finished request ran more than once"""
+    repeated = stats.repeated()
+    if repeated:
+        db_repeated_queries_total.inc((stats.route,))
+    if repeated and settings.debug:
+        print("repeated_queries " + json.dumps({"route": stats.route, "statements": repeated}))
+    return repeated
+
+
+def instrument_engine(engine: Engine):
+    """Attach the profiler's hooks to a (sync) engine"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
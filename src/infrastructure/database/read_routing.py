@@ -0,0 +1,29 @@
+"""
+Read-your-writes bookkeeping for read replica routing.
+A user who has just written is served from the primary for a short
+window so they never read a replica that has not caught up yet.
+The window is tracked per worker process.
+"""
+from src.infrastructure.config.settings import settings
+from ..cache.ttl_lru_cache import TTLLRUCache
+
+
+class RecentWriters:
+    """Remembers which users wrote within the last read_your_writes_seconds"""
+    
+    def __init__(self, window_seconds: float, max_users: int):
+        self._writers = TTLLRUCache(max_entries=max_users, ttl_seconds=window_seconds)
+    
+    def mark(self, user_id: str):
+        """Record that a user just wrote; restarts their window"""
+        self._writers.set(user_id, True)
+    
+    def is_pinned(self, user_id: str) -> bool:
+        """True if the user's reads must go to the primary"""
+        return self._writers.get(user_id) is not None
+
+
+recent_writers = RecentWriters(
+    window_seconds=settings.read_your_writes_seconds,
+    max_users=settings.read_your_writes_max_users
+)
@@ -5,8 +5,10 @@ These are the concrete implementations that use SQLAlchemy.
 
 from .user_repository_impl import UserRepositoryImpl
 from .todo_repository_impl import TodoRepositoryImpl
+from .todo_counter_repository_impl import TodoCounterRepositoryImpl
 
 __all__ = [
     "UserRepositoryImpl",
     "TodoRepositoryImpl",
+    "TodoCounterRepositoryImpl",
 ]
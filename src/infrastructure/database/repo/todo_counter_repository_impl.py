@@ -0,0 +1,125 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, case
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from src.domain.entities.todo_counters import TodoCounters
+from src.domain.repo.TodoCounterRepository import TodoCounterRepository
+from ..models.todo_counter_model import TodoCounterModel
+from ..models.todo_model import TodoModel
+from ..models.user_model import UserModel
+
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class TodoCounterRepositoryImpl(TodoCounterRepository):
+    """
+    SQLAlchemy implementation of TodoCounterRepository.
+    add() runs in the caller's session and leaves committing to it, so the
+    counters move in the same transaction as the todo write.
+    """
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get(self, user_id: str) -> Optional[TodoCounters]:
+        """Get a user's counters with a primary-key lookup, None if they have none yet"""
+        try:
+            counter_model = await self.session.get(TodoCounterModel, UUID(user_id))
+            if counter_model:
+                return self._model_to_entity(counter_model)
+            return None
+        except ValueError as e:
+            print(f"Invalid UUID format: {user_id}, error: {e}")
+            return None
+    
+    async def add(self, user_id: str, total: int = 0, completed: int = 0) -> None:
+        """Add the given deltas to a user's counters in one upsert"""
+        if not total and not completed:
+            return
+        await self._upsert(UUID(user_id), total, completed, relative=True)
+    
+    async def reconcile(self, batch_size: int = 1000) -> int:
+        """Recount todos batch by batch of users and overwrite drifted counters; commits each batch"""
+        repaired = 0
+        after = None
+        while True:
+            query = select(UserModel.id).order_by(UserModel.id).limit(batch_size)
+            if after is not None:
+                query = query.where(UserModel.id > after)
+            user_ids = list((await self.session.scalars(query)).all())
+            if not user_ids:
+                return repaired
+            after = user_ids[-1]
+            
+            # Lock the stored counters first: a todo write that already moved
+            # them has committed by the time we get the lock (so the recount
+            # sees it), and one that has not waits for us and applies its
+            # delta on top of the repaired value
+            stored_query = (
+                select(TodoCounterModel.user_id, TodoCounterModel.total, TodoCounterModel.completed)
+                .where(TodoCounterModel.user_id.in_(user_ids))
+                .with_for_update()
+            )
+            stored = {row[0]: (row[1], row[2]) for row in (await self.session.execute(stored_query)).all()}
+            
+            actual_query = (
+                select(
+                    TodoModel.user_id,
+                    func.count(),
+                    func.sum(case((TodoModel.completed == True, 1), else_=0))
+                )
+                .where(TodoModel.user_id.in_(user_ids))
+                .group_by(TodoModel.user_id)
+            )
+            actual = {row[0]: (row[1], int(row[2] or 0)) for row in (await self.session.execute(actual_query)).all()}
+            
+            for user_id in user_ids:
+                counts = actual.get(user_id, (0, 0))
+                if stored.get(user_id, (0, 0)) != counts:
+                    await self._upsert(user_id, counts[0], counts[1], relative=False)
+                    repaired += 1
+            
+            await self.session.commit()
+    
+    async def _upsert(self, user_id: UUID, total: int, completed: int, relative: bool):
+        """Insert a counters row, or add to (relative) / overwrite the existing one"""
+        now = datetime.utcnow()
+        if relative:
+            values = {
+                "total": TodoCounterModel.total + total,
+                "completed": TodoCounterModel.completed + completed,
+            }
+        else:
+            values = {"total": total, "completed": completed}
+        values["updated_at"] = now
+        
+        connection = await self.session.connection()
+        make_insert = _UPSERT_INSERTS.get(connection.dialect.name)
+        if make_insert is not None:
+            query = make_insert(TodoCounterModel).values(
+                user_id=user_id, total=total, completed=completed, updated_at=now
+            ).on_conflict_do_update(index_elements=[TodoCounterModel.user_id], set_=values)
+            await self.session.execute(query)
+            return
+        
+        # Other backends: update, then insert if there was nothing to update
+        result = await self.session.execute(
+            update(TodoCounterModel).where(TodoCounterModel.user_id == user_id).values(**values)
+        )
+        if result.rowcount == 0:
+            self.session.add(TodoCounterModel(user_id=user_id, total=total, completed=completed, updated_at=now))
+            await self.session.flush()
+    
+    def _model_to_entity(self, counter_model: TodoCounterModel) -> TodoCounters:
+        """Convert database model to domain entity"""
+        return TodoCounters(
+            user_id=str(counter_model.user_id),
+            total=counter_model.total,
+            completed=counter_model.completed
+        )
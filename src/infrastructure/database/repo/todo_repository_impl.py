@@ -1,11 +1,29 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, update
-from typing import Optional, List
+from sqlalchemy import select, insert, delete, update, tuple_, func, literal_column, and_, or_, table, column
+from datetime import datetime
+import re
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID
 
 from src.domain.entities.todo import Todo
 from src.domain.repo.TodoRepository import TodoRepository
 from ..models.todo_model import TodoModel
+from ..models.user_model import UserModel
+
+# SQLite FTS5 index created alongside the todos table (see todo_model.py)
+_todos_fts = table("todos_fts", column("rowid"))
+
+# Columns selected by read paths that hydrate entities straight from rows,
+# in the order _row_to_entity expects
+_TODO_COLUMNS = (
+    TodoModel.id,
+    TodoModel.user_id,
+    TodoModel.title,
+    TodoModel.description,
+    TodoModel.completed,
+    TodoModel.created_at,
+    TodoModel.completed_at
+)
 
 
 class TodoRepositoryImpl(TodoRepository):
@@ -43,16 +61,83 @@ class TodoRepositoryImpl(TodoRepository):
         # Convert back to domain entity
         return self._model_to_entity(todo_model)
     
+    async def save_many(self, todos: List[Todo]) -> List[Todo]:
+        """Save several todos in one batch and return them in the same order"""
+        if not todos:
+            return []
+        
+        try:
+            rows = [
+                {
+                    "id": UUID(todo.id) if isinstance(todo.id, str) else todo.id,
+                    "user_id": UUID(todo.user_id) if isinstance(todo.user_id, str) else todo.user_id,
+                    "title": todo.title,
+                    "description": todo.description,
+                    "completed": todo.completed,
+                    "created_at": todo.created_at,
+                    "completed_at": todo.completed_at
+                }
+                for todo in todos
+            ]
+        except ValueError as e:
+            print(f"Error saving todos - Invalid UUID: {e}")
+            raise ValueError("Invalid ID format")
+        
+        # One multi-row INSERT ... RETURNING instead of a flush per todo;
+        # SQLAlchemy only splits it when a batch exceeds the driver's parameter limits
+        query = insert(TodoModel).returning(*_TODO_COLUMNS, sort_by_parameter_order=True)
+        result = await self.session.execute(query, rows)
+        
+        return [self._row_to_entity(row) for row in result]
+    
+    async def import_many(self, todos: List[Todo]) -> int:
+        """Bulk-load todos (binary COPY on asyncpg, executemany elsewhere) and commit"""
+        if not todos:
+            return 0
+        
+        records = [
+            (
+                UUID(todo.id),
+                UUID(todo.user_id),
+                todo.title,
+                todo.description,
+                todo.completed,
+                todo.created_at,
+                todo.completed_at
+            )
+            for todo in todos
+        ]
+        columns = ["id", "user_id", "title", "description", "completed", "created_at", "completed_at"]
+        
+        try:
+            connection = await self.session.connection()
+            if connection.dialect.driver == "asyncpg":
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    TodoModel.__tablename__, records=records, columns=columns
+                )
+            else:
+                await self.session.execute(
+                    insert(TodoModel),
+                    [dict(zip(columns, record)) for record in records]
+                )
+            await self.session.commit()
+            return len(records)
+        except Exception as e:
+            await self.session.rollback()
+            print(f"Error importing todos: {e}")
+            raise ValueError(f"Could not write todos: {e.__class__.__name__}")
+    
     async def get_by_id(self, todo_id: str) -> Optional[Todo]:
         """Get todo by ID, return None if not found"""
         try:
             uuid_obj = UUID(todo_id)
-            query = select(TodoModel).where(TodoModel.id == uuid_obj)
+            query = select(*_TODO_COLUMNS).where(TodoModel.id == uuid_obj)
             result = await self.session.execute(query)
-            todo_model = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if todo_model:
-                return self._model_to_entity(todo_model)
+            if row:
+                return self._row_to_entity(row)
             return None
         except ValueError as e:
             print(f"Invalid UUID format: {todo_id}, error: {e}")
@@ -62,15 +147,124 @@ class TodoRepositoryImpl(TodoRepository):
         """Get all todos for a specific user"""
         try:
             uuid_obj = UUID(user_id)
-            query = select(TodoModel).where(TodoModel.user_id == uuid_obj)
+            query = select(*_TODO_COLUMNS).where(TodoModel.user_id == uuid_obj)
             result = await self.session.execute(query)
-            todo_models = result.scalars().all()
             
-            return [self._model_to_entity(model) for model in todo_models]
+            return [self._row_to_entity(row) for row in result]
         except ValueError as e:
             print(f"Invalid UUID format: {user_id}, error: {e}")
             return []
     
+    async def get_page_rows_by_user_id(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        completed: Optional[bool] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ) -> List[tuple]:
+        """Get up to `limit` matching todos for a user ordered by (created_at, id), starting after the given key, as column tuples"""
+        try:
+            query = self._page_query(select(*_TODO_COLUMNS), user_id, limit, after, completed, created_after, created_before)
+            result = await self.session.execute(query)
+            return [tuple(row) for row in result.all()]
+        except ValueError as e:
+            print(f"Invalid UUID format: {user_id}, error: {e}")
+            return []
+    
+    async def iter_rows_by_user_id(self, user_id: str, chunk_size: int) -> AsyncIterator[List[tuple]]:
+        """Stream a user's todos in keyset-ordered chunks, releasing the connection between chunks"""
+        after = None
+        while True:
+            rows = await self.get_page_rows_by_user_id(user_id, chunk_size, after)
+            
+            # Give the connection back before handing the chunk to a consumer
+            # that may be slow (e.g. a client downloading an export)
+            await self.session.close()
+            
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            
+            after = (rows[-1][5], str(rows[-1][0]))
+    
+    async def search_by_user_id(self, user_id: str, query: str, limit: int, after: Optional[Tuple[float, str]] = None) -> List[Tuple[Todo, float]]:
+        """Full-text search a user's todos, best match first, starting after the given (rank, id) key"""
+        try:
+            uuid_obj = UUID(user_id)
+            after_key = (after[0], UUID(after[1])) if after is not None else None
+        except ValueError as e:
+            print(f"Invalid UUID format: {user_id}, error: {e}")
+            return []
+        
+        connection = await self.session.connection()
+        if connection.dialect.name == "postgresql":
+            # Served by the GIN index on the generated search_vector column
+            ts_query = func.websearch_to_tsquery(literal_column("'english'::regconfig"), query)
+            search_vector = literal_column("todos.search_vector")
+            rank = func.ts_rank(search_vector, ts_query)
+            statement = select(*_TODO_COLUMNS, rank.label("rank")).where(search_vector.op("@@")(ts_query))
+        else:
+            # FTS5 fallback; quote each word so user input is never parsed as query syntax
+            words = re.findall(r"\w+", query)
+            if not words:
+                return []
+            match = " ".join(f'"{word}"' for word in words)
+            fts = literal_column("todos_fts")
+            # bm25 is lower-is-better; negate it so both backends rank descending
+            rank = -func.bm25(fts, 1.0, 0.4)
+            statement = (
+                select(*_TODO_COLUMNS, rank.label("rank"))
+                .select_from(TodoModel)
+                .join(_todos_fts, _todos_fts.c.rowid == literal_column("todos.rowid"))
+                .where(fts.op("MATCH")(match))
+            )
+        
+        statement = statement.where(TodoModel.user_id == uuid_obj)
+        if after_key is not None:
+            after_rank, after_id = after_key
+            statement = statement.where(or_(rank < after_rank, and_(rank == after_rank, TodoModel.id > after_id)))
+        statement = statement.order_by(rank.desc(), TodoModel.id).limit(limit)
+        
+        result = await self.session.execute(statement)
+        return [(self._row_to_entity(row[:7]), float(row.rank)) for row in result]
+    
+    def _page_query(
+        self,
+        query,
+        user_id: str,
+        limit: int,
+        after: Optional[Tuple[datetime, str]],
+        completed: Optional[bool] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None
+    ):
+        """Restrict `query` to one keyset page of a user's matching todos"""
+        query = query.where(TodoModel.user_id == UUID(user_id))
+        
+        # Written exactly like the WHERE clauses of the partial indexes in
+        # todo_model.py so the planner can use them
+        if completed is True:
+            query = query.where(TodoModel.completed == True)
+        elif completed is False:
+            query = query.where(TodoModel.completed == False)
+        if created_after is not None:
+            query = query.where(TodoModel.created_at >= created_after)
+        if created_before is not None:
+            query = query.where(TodoModel.created_at < created_before)
+        
+        # Keyset condition: served by ix_todos_user_id_created_at_id, so the
+        # cost of a page does not depend on how deep the client has scrolled
+        if after is not None:
+            after_created_at, after_id = after
+            query = query.where(
+                tuple_(TodoModel.created_at, TodoModel.id) > tuple_(after_created_at, UUID(after_id))
+            )
+        
+        return query.order_by(TodoModel.created_at, TodoModel.id).limit(limit)
+    
     async def update(self, todo: Todo) -> Todo:
         """Update an existing todo"""
         try:
@@ -98,6 +292,54 @@ class TodoRepositoryImpl(TodoRepository):
             print(f"Invalid UUID format: {todo.id}, error: {e}")
             raise ValueError(f"Invalid todo ID format")
     
+    async def update_for_user(self, todo_id: str, user_id: str, title: Optional[str] = None, description: Optional[str] = None) -> Optional[Todo]:
+        """Update a user's todo in one statement; changing the title also requires it to be pending. Return None if nothing matched"""
+        try:
+            query = update(TodoModel).where(
+                TodoModel.id == UUID(todo_id),
+                TodoModel.user_id == UUID(user_id)
+            )
+            values = {}
+            if title is not None:
+                values["title"] = title
+                query = query.where(TodoModel.completed == False)
+            if description is not None:
+                values["description"] = description
+            
+            query = query.values(**values).returning(*_TODO_COLUMNS)
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            
+            if row:
+                return self._row_to_entity(row)
+            return None
+        except ValueError as e:
+            print(f"Invalid UUID format: {todo_id}, error: {e}")
+            return None
+    
+    async def complete_for_user(self, todo_id: str, user_id: str, completed_at: datetime) -> Optional[Todo]:
+        """Mark a user's pending todo complete in one statement, return None if nothing matched"""
+        try:
+            query = (
+                update(TodoModel)
+                .where(
+                    TodoModel.id == UUID(todo_id),
+                    TodoModel.user_id == UUID(user_id),
+                    TodoModel.completed == False
+                )
+                .values(completed=True, completed_at=completed_at)
+                .returning(*_TODO_COLUMNS)
+            )
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            
+            if row:
+                return self._row_to_entity(row)
+            return None
+        except ValueError as e:
+            print(f"Invalid UUID format: {todo_id}, error: {e}")
+            return None
+    
     async def delete(self, todo_id: str) -> bool:
         """Delete todo, return True if deleted, False if not found"""
         try:
@@ -110,18 +352,34 @@ class TodoRepositoryImpl(TodoRepository):
             return False
         return result.rowcount > 0
     
+    async def delete_for_user(self, todo_id: str, user_id: str) -> Optional[Todo]:
+        """Delete a user's todo in one statement, return the deleted todo or None if nothing matched"""
+        try:
+            query = delete(TodoModel).where(
+                TodoModel.id == UUID(todo_id),
+                TodoModel.user_id == UUID(user_id)
+            ).returning(*_TODO_COLUMNS)
+            result = await self.session.execute(query)
+            row = result.one_or_none()
+            
+            if row:
+                return self._row_to_entity(row)
+            return None
+        except ValueError as e:
+            print(f"Invalid UUID format: {todo_id}, error: {e}")
+            return None
+    
     async def get_completed_todos(self, user_id: str) -> List[Todo]:
         """Get all completed todos for a user"""
         try:
             uuid_obj = UUID(user_id)
-            query = select(TodoModel).where(
+            query = select(*_TODO_COLUMNS).where(
                 TodoModel.user_id == uuid_obj,
                 TodoModel.completed == True
             )
             result = await self.session.execute(query)
-            todo_models = result.scalars().all()
             
-            return [self._model_to_entity(model) for model in todo_models]
+            return [self._row_to_entity(row) for row in result]
         except ValueError as e:
             print(f"Invalid UUID format: {user_id}, error: {e}")
             return []
@@ -130,27 +388,54 @@ class TodoRepositoryImpl(TodoRepository):
         """Get all pending todos for a user"""
         try:
             uuid_obj = UUID(user_id)
-            query = select(TodoModel).where(
+            query = select(*_TODO_COLUMNS).where(
                 TodoModel.user_id == uuid_obj,
                 TodoModel.completed == False
             )
             result = await self.session.execute(query)
-            todo_models = result.scalars().all()
             
-            return [self._model_to_entity(model) for model in todo_models]
+            return [self._row_to_entity(row) for row in result]
         except ValueError as e:
             print(f"Invalid UUID format: {user_id}, error: {e}")
             return []
     
+    async def get_version(self, user_id: str) -> int:
+        """Get the version marker of a user's todos, 0 if unknown"""
+        try:
+            query = select(UserModel.todos_version).where(UserModel.id == UUID(user_id))
+            result = await self.session.execute(query)
+            return result.scalar_one_or_none() or 0
+        except ValueError as e:
+            print(f"Invalid UUID format: {user_id}, error: {e}")
+            return 0
+    
+    async def bump_version(self, user_id: str) -> None:
+        """Advance the version marker of a user's todos after a change"""
+        query = (
+            update(UserModel)
+            .where(UserModel.id == UUID(user_id))
+            .values(todos_version=UserModel.todos_version + 1)
+        )
+        await self.session.execute(query)
+    
     def _model_to_entity(self, todo_model: TodoModel) -> Todo:
-        """Convert database model to domain entity"""
-        todo = Todo(
-            id=str(todo_model.id),
-            user_id=str(todo_model.user_id),
-            title=todo_model.title,
-            description=todo_model.description or ""
+        """Convert database model to domain entity; for ORM write paths that already hold a model"""
+        return Todo(
+            str(todo_model.id),
+            str(todo_model.user_id),
+            todo_model.title,
+            todo_model.description or "",
+            todo_model.completed,
+            todo_model.created_at,
+            todo_model.completed_at
         )
-        todo.completed = todo_model.completed
-        todo.created_at = todo_model.created_at
-        todo.completed_at = todo_model.completed_at
-        return todo
+    
+    @staticmethod
+    def _row_to_entity(row) -> Todo:
+        """
+        Build a domain entity straight from a row of _TODO_COLUMNS. Read
+        paths select columns rather than TodoModel, so no ORM instance is
+        built or tracked in the session's identity map.
+        """
+        todo_id, user_id, title, description, completed, created_at, completed_at = row
+        return Todo(str(todo_id), str(user_id), title, description or "", completed, created_at, completed_at)
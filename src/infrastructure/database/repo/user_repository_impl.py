@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
@@ -7,6 +8,18 @@ from src.domain.entities.user import User
 from src.domain.repo.UserRepository import UserRepository
 from ..models.user_model import UserModel
 
+# Columns selected by read paths that hydrate entities straight from rows,
+# in the order _row_to_entity expects
+_USER_COLUMNS = (
+    UserModel.id,
+    UserModel.username,
+    UserModel.email,
+    UserModel.password_hash,
+    UserModel.is_active,
+    UserModel.created_at,
+    UserModel.updated_at
+)
+
 
 class UserRepositoryImpl(UserRepository):
     """
@@ -46,12 +59,12 @@ class UserRepositoryImpl(UserRepository):
         try:
             # Validate and convert string to UUID
             uuid_obj = UUID(user_id)
-            query = select(UserModel).where(UserModel.id == uuid_obj)
+            query = select(*_USER_COLUMNS).where(UserModel.id == uuid_obj)
             result = await self.session.execute(query)
-            user_model = result.scalar_one_or_none()
+            row = result.one_or_none()
             
-            if user_model:
-                return self._model_to_entity(user_model)
+            if row:
+                return self._row_to_entity(row)
             return None
         except ValueError as e:
             # Invalid UUID format
@@ -60,24 +73,35 @@ class UserRepositoryImpl(UserRepository):
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
-        query = select(UserModel).where(UserModel.email == email)
+        query = select(*_USER_COLUMNS).where(UserModel.email == email)
         result = await self.session.execute(query)
-        user_model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if user_model:
-            return self._model_to_entity(user_model)
+        if row:
+            return self._row_to_entity(row)
         return None
     
     async def get_by_username(self, username: str) -> Optional[User]:
         """Get user by username"""
-        query = select(UserModel).where(UserModel.username == username)
+        query = select(*_USER_COLUMNS).where(UserModel.username == username)
         result = await self.session.execute(query)
-        user_model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if user_model:
-            return self._model_to_entity(user_model)
+        if row:
+            return self._row_to_entity(row)
         return None
     
+    async def update_password_hash(self, user_id: str, password_hash: str) -> bool:
+        """Replace a user's password hash"""
+        query = (
+            update(UserModel)
+            .where(UserModel.id == UUID(user_id))
+            .values(password_hash=password_hash, updated_at=datetime.utcnow())
+        )
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.rowcount > 0
+    
     async def delete(self, user_id: str) -> bool:
         """Delete user by ID"""
         query = delete(UserModel).where(UserModel.id == UUID(user_id))
@@ -94,4 +118,12 @@ class UserRepositoryImpl(UserRepository):
             password_hash=user_model.password_hash,
             is_active=user_model.is_active,
             created_at=user_model.created_at
-        )
\ No newline at end of file
+        )
+    
+    @staticmethod
+    def _row_to_entity(row) -> User:
+        """Build a User straight from a row of _USER_COLUMNS, without an ORM instance"""
+        user_id, username, email, password_hash, is_active, created_at, updated_at = row
+        user = User(str(user_id), username, email, password_hash, is_active, created_at)
+        user.updated_at = updated_at
+        return user
@@ -0,0 +1 @@
+# In-process metrics in the Prometheus text format
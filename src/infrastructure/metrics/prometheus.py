@@ -0,0 +1,146 @@
+"""
+Minimal in-process metrics in the Prometheus text exposition format.
+Counters, gauges and histograms keyed by label values, rendered on demand
+for a /metrics scrape; no client library or push gateway involved.
+"""
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+    
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic total per label set"""
+    kind = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+    
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+    
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in self.values.items()
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down per label set"""
+    kind = "gauge"
+    
+    def dec(self, labels: Tuple[str, ...] = (), amount: float = 1.0):
+        self.inc(labels, -amount)
+    
+    def set(self, labels: Tuple[str, ...] = (), value: float = 0.0):
+        self.values[labels] = value
+
+
+class Histogram(_Metric):
+    """Observation counts in cumulative buckets, plus their sum and count, per label set"""
+    kind = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last one is +Inf), sum]
+        self.values: Dict[Tuple[str, ...], list] = {}
+    
+    def observe(self, labels: Tuple[str, ...], value: float):
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        # Counts are stored per bucket and made cumulative when rendered
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+    
+    def _samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total) in self.values.items():
+            cumulative = 0
+            for upper, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(upper)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds the process's metrics and renders them for a scrape"""
+    
+    CONTENT_TYPE = "text/plain; version=0.0.4"
+    
+    def __init__(self):
+        self.metrics: Dict[str, _Metric] = {}
+        self.collectors: List[Callable[[], None]] = []
+    
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def on_collect(self, callback: Callable[[], None]):
+        """Run `callback` before each render, e.g. to copy live state into gauges"""
+        self.collectors.append(callback)
+    
+    def render(self) -> str:
+        for callback in self.collectors:
+            callback()
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1 @@
+# On-demand profiling of live workers
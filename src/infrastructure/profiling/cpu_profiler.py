@@ -0,0 +1,354 @@
+"""
+On-demand CPU profiling of a live worker's event loop.
+A background thread samples the loop thread's Python stack at a fixed
+interval and counts identical stacks, giving the collapsed-stack format
+flame graph tools read. While it runs, a probe coroutine measures how
+late the loop wakes it (event-loop lag), and coroutine steps are timed
+to find the slowest ones. Nothing is installed outside a run, so it
+costs nothing to keep in production builds.
+
+Works on the asyncio loop and on uvloop (what uvicorn[standard] runs).
+uvloop's own callbacks are C code the sampler cannot see into: samples
+taken there count as idle, and only the steps of tasks started during
+the profile (every request handled meanwhile) are timed.
+"""
+import asyncio
+import heapq
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Coroutine
+from typing import Dict, List, Optional
+
+LAG_PROBE_INTERVAL = 0.01
+TOP_N = 20
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile is requested while another one is running"""
+    pass
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _describe_callback(callback) -> str:
+    """Coroutine name for task steps and wakeups, the callable's name otherwise"""
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        return getattr(coro, "__qualname__", None) or repr(coro)
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+def _is_idle(frame_label: str, driver_label: Optional[str] = None) -> bool:
+    """
+    True for the loop waiting for I/O: the innermost frame is the
+    selector's wait (e.g. "EpollSelector.select (selectors.py:451)") or,
+    on loops written in C, the Python frame that runs the loop
+    """
+    if frame_label == driver_label:
+        return True
+    function, _, location = frame_label.partition(" (")
+    return function.endswith("select") and "selectors.py:" in location
+
+
+def _loop_driver_code():
+    """
+    Code of the frame that runs the event loop, found below the calling
+    coroutine's await chain. On uvloop it is the caller of
+    run_until_complete (e.g. asyncio.Runner.run); everything between it
+    and the coroutines is C.
+    """
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_code.co_flags & (inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR):
+        frame = frame.f_back
+    return frame.f_code
+
+
+class _StackSampler(threading.Thread):
+    """Counts the stacks of one thread, sampled every `interval` seconds"""
+    
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="cpu-profiler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop_event = threading.Event()
+        self._labels: Dict[object, str] = {}
+        self._prefixes = sorted({os.path.join(path, "") for path in sys.path if path}, key=len, reverse=True)
+    
+    def label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = self._label(code)
+        return label
+    
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+    
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            
+            labels = []
+            while frame is not None:
+                labels.append(self.label(frame.f_code))
+                frame = frame.f_back
+            
+            labels.reverse()
+            self.stacks[";".join(labels)] += 1
+            self.samples += 1
+    
+    def _label(self, code) -> str:
+        filename = code.co_filename
+        for prefix in self._prefixes:
+            if filename.startswith(prefix):
+                filename = filename[len(prefix):]
+                break
+        # ';' separates frames in the collapsed format
+        return f"{code.co_qualname} ({filename}:{code.co_firstlineno})".replace(";", ":")
+
+
+class _StepTimer:
+    """Per-coroutine step counts and durations, plus the slowest steps"""
+    
+    def __init__(self):
+        self.by_name: Dict[str, List[float]] = {}  # name -> [count, total, max]
+        self.slowest: List[tuple] = []  # min-heap of (seconds, name)
+        self.active = False
+    
+    def record(self, name: str, seconds: float):
+        entry = self.by_name.get(name)
+        if entry is None:
+            entry = self.by_name[name] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+        
+        if len(self.slowest) < TOP_N:
+            heapq.heappush(self.slowest, (seconds, name))
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, name))
+
+
+class _HandleStepTimer(_StepTimer):
+    """Times every callback the asyncio loop runs on its thread while installed"""
+    
+    def __init__(self, thread_id: int):
+        super().__init__()
+        self.thread_id = thread_id
+        self._original_run = None
+    
+    def install(self, loop: asyncio.AbstractEventLoop):
+        original_run = self._original_run = asyncio.events.Handle._run
+        timer = self
+        
+        def timed_run(handle):
+            if threading.get_ident() != timer.thread_id:
+                return original_run(handle)
+            started = time.perf_counter()
+            try:
+                return original_run(handle)
+            finally:
+                timer.record(_describe_callback(handle._callback), time.perf_counter() - started)
+        
+        asyncio.events.Handle._run = timed_run
+        self.active = True
+    
+    def uninstall(self):
+        self.active = False
+        if self._original_run is not None:
+            asyncio.events.Handle._run = self._original_run
+            self._original_run = None
+
+
+class _TimedCoroutine(Coroutine):
+    """A task's coroutine whose every step (send/throw) is timed"""
+    
+    __slots__ = ("_coro", "_timer", "_name")
+    
+    def __init__(self, coro, timer: _StepTimer):
+        self._coro = coro
+        self._timer = timer
+        self._name = getattr(coro, "__qualname__", None) or repr(coro)
+    
+    def send(self, value):
+        # Tasks can outlive the profile; they stop being timed with it
+        if not self._timer.active:
+            return self._coro.send(value)
+        started = time.perf_counter()
+        try:
+            return self._coro.send(value)
+        finally:
+            self._timer.record(self._name, time.perf_counter() - started)
+    
+    def throw(self, *args):
+        if not self._timer.active:
+            return self._coro.throw(*args)
+        started = time.perf_counter()
+        try:
+            return self._coro.throw(*args)
+        finally:
+            self._timer.record(self._name, time.perf_counter() - started)
+    
+    def close(self):
+        return self._coro.close()
+    
+    def __await__(self):
+        return self._coro.__await__()
+
+
+class _TaskStepTimer(_StepTimer):
+    """
+    Times the steps of tasks created while installed, through the loop's
+    task factory. For loops like uvloop whose callbacks cannot be patched.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._loop = None
+        self._previous_factory = None
+    
+    def install(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        previous_factory = self._previous_factory = loop.get_task_factory()
+        timer = self
+        
+        def timed_task_factory(loop, coro, **kwargs):
+            coro = _TimedCoroutine(coro, timer)
+            if previous_factory is not None:
+                return previous_factory(loop, coro, **kwargs)
+            return asyncio.Task(coro, loop=loop, **kwargs)
+        
+        loop.set_task_factory(timed_task_factory)
+        self.active = True
+    
+    def uninstall(self):
+        self.active = False
+        if self._loop is not None:
+            self._loop.set_task_factory(self._previous_factory)
+            self._loop = None
+
+
+class EventLoopProfiler:
+    """Runs one profile of the current event loop at a time"""
+    
+    def __init__(self):
+        self._running = False
+    
+    async def profile(self, seconds: float, interval: float, include_idle: bool = False) -> dict:
+        """
+        Profile the running loop for `seconds`, sampling every `interval`
+        seconds, while it keeps serving requests. Samples taken while the
+        loop waits in select() are idle and left out of the stacks unless
+        `include_idle`.
+        """
+        if self._running:
+            raise ProfilerBusyError("A profile is already running in this worker")
+        self._running = True
+        
+        loop = asyncio.get_running_loop()
+        thread_id = threading.get_ident()
+        sampler = _StackSampler(thread_id, interval)
+        if isinstance(loop, asyncio.BaseEventLoop):
+            step_timer = _HandleStepTimer(thread_id)
+            driver_label = None
+        else:
+            # uvloop runs its own C handles, which cannot be patched
+            step_timer = _TaskStepTimer()
+            driver_label = sampler.label(_loop_driver_code())
+        lags: List[float] = []
+        stop = asyncio.Event()
+        
+        async def probe_lag():
+            while not stop.is_set():
+                started = time.perf_counter()
+                await asyncio.sleep(LAG_PROBE_INTERVAL)
+                lags.append(max(time.perf_counter() - started - LAG_PROBE_INTERVAL, 0.0))
+        
+        probe = None
+        started = time.perf_counter()
+        try:
+            step_timer.install(loop)
+            sampler.start()
+            probe = asyncio.create_task(probe_lag())
+            await asyncio.sleep(seconds)
+            stop.set()
+            await probe
+        finally:
+            # Also reached when the request is cancelled mid-profile
+            stop.set()
+            if probe is not None and not probe.done():
+                probe.cancel()
+            if sampler.is_alive():
+                sampler.stop()
+            step_timer.uninstall()
+            self._running = False
+        elapsed = time.perf_counter() - started
+        
+        return self._report(sampler, step_timer, driver_label, lags, elapsed, interval, include_idle)
+    
+    @staticmethod
+    def _report(sampler: _StackSampler, step_timer: _StepTimer, driver_label: Optional[str], lags: List[float],
+                elapsed: float, interval: float, include_idle: bool) -> dict:
+        idle = {
+            stack: count for stack, count in sampler.stacks.items()
+            if _is_idle(stack.rsplit(";", 1)[-1], driver_label)
+        }
+        idle_samples = sum(idle.values())
+        stacks = sampler.stacks if include_idle else Counter({
+            stack: count for stack, count in sampler.stacks.items() if stack not in idle
+        })
+        
+        leaf_functions = Counter()
+        for stack, count in stacks.items():
+            leaf_functions[stack.rsplit(";", 1)[-1]] += count
+        
+        return {
+            "pid": os.getpid(),
+            "seconds": round(elapsed, 3),
+            "interval_ms": round(interval * 1000, 3),
+            "samples": sampler.samples,
+            "idle_samples": idle_samples,
+            "busy_pct": round((sampler.samples - idle_samples) / sampler.samples * 100, 1) if sampler.samples else 0.0,
+            "loop_lag_ms": {
+                "probes": len(lags),
+                "mean": round(sum(lags) / len(lags) * 1000, 3) if lags else 0.0,
+                "p50": round(_percentile(lags, 0.50) * 1000, 3),
+                "p99": round(_percentile(lags, 0.99) * 1000, 3),
+                "max": round(max(lags, default=0.0) * 1000, 3)
+            },
+            "top_functions": [
+                {"function": function, "samples": count}
+                for function, count in leaf_functions.most_common(TOP_N)
+            ],
+            # "callbacks" on asyncio; "new_tasks" on uvloop, where only tasks
+            # started during the profile are timed
+            "steps_timed": "callbacks" if isinstance(step_timer, _HandleStepTimer) else "new_tasks",
+            "slowest_steps": [
+                {"coroutine": name, "duration_ms": round(seconds * 1000, 3)}
+                for seconds, name in sorted(step_timer.slowest, reverse=True)
+            ],
+            "steps_by_coroutine": [
+                {"coroutine": name, "steps": count, "total_ms": round(total * 1000, 3), "max_ms": round(longest * 1000, 3)}
+                for name, (count, total, longest) in sorted(
+                    step_timer.by_name.items(), key=lambda item: item[1][1], reverse=True
+                )[:TOP_N]
+            ],
+            "collapsed": "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        }
+
+
+cpu_profiler = EventLoopProfiler()
@@ -0,0 +1,182 @@
+"""
+On-demand memory snapshots of a live worker.
+tracemalloc is started with the first snapshot (it only sees allocations
+made after that) and stopped again when the snapshots are cleared, so a
+worker pays for allocation tracing only while someone is investigating.
+Snapshots can be diffed by file and line to find what grew in between.
+"""
+import asyncio
+import gc
+import os
+import resource
+import sys
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.config.settings import settings
+
+GROUP_BY = ("lineno", "filename", "traceback")
+
+# Allocations made by tracemalloc and the import system are noise here
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    for prefix in sorted({os.path.join(path, "") for path in sys.path if path}, key=len, reverse=True):
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: str) -> str:
+    if group_by == "traceback":
+        return " <- ".join(f"{_short_path(frame.filename)}:{frame.lineno}" for frame in traceback)
+    frame = traceback[0]
+    if group_by == "filename":
+        return _short_path(frame.filename)
+    return f"{_short_path(frame.filename)}:{frame.lineno}"
+
+
+def rss_bytes() -> int:
+    """Current resident set size; the peak where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def count_instances(classes: Iterable[type]) -> Dict[str, int]:
+    """
+    Live instances of each class (subclasses included) among the objects
+    the garbage collector tracks. Walks the whole heap, so it takes a
+    while on a big worker.
+    """
+    classes = tuple(classes)
+    counts = {cls.__name__: 0 for cls in classes}
+    # Which of `classes` each type seen is an instance of, worked out once per type
+    matches: Dict[type, List[str]] = {}
+    for obj in gc.get_objects():
+        cls = type(obj)
+        names = matches.get(cls)
+        if names is None:
+            names = matches[cls] = [tracked.__name__ for tracked in classes if issubclass(cls, tracked)]
+        for name in names:
+            counts[name] += 1
+    return counts
+
+
+class MemorySnapshots:
+    """The most recent tracemalloc snapshots of this worker, by id"""
+    
+    def __init__(self, max_snapshots: int):
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[int, Tuple[datetime, tracemalloc.Snapshot]]" = OrderedDict()
+        self._next_id = 1
+        self._started_tracing = False
+        self._lock = asyncio.Lock()
+    
+    async def take(self, frames: int = 1, limit: int = 25) -> dict:
+        """
+        Snapshot the traced allocations (starting tracemalloc with `frames`
+        frames per allocation if it is not running) and summarize the top
+        `limit` allocators by line. The oldest snapshot is dropped past
+        max_snapshots.
+        """
+        async with self._lock:
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(frames)
+                self._started_tracing = True
+            
+            # Filtering and grouping are pure Python; keep them off the event loop
+            snapshot = await asyncio.to_thread(lambda: tracemalloc.take_snapshot().filter_traces(_FILTERS))
+            snapshot_id = self._next_id
+            self._next_id += 1
+            taken_at = datetime.utcnow()
+            self._snapshots[snapshot_id] = (taken_at, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+            
+            statistics = await asyncio.to_thread(snapshot.statistics, "lineno")
+        
+        return {
+            "id": snapshot_id,
+            "pid": os.getpid(),
+            "taken_at": taken_at,
+            "tracing_started": started_tracing,
+            "traceback_frames": snapshot.traceback_limit,
+            "traced_bytes": sum(stat.size for stat in statistics),
+            "traced_blocks": sum(stat.count for stat in statistics),
+            "tracemalloc_overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            "rss_bytes": rss_bytes(),
+            "top": [
+                {"location": _location(stat.traceback, "lineno"), "size_bytes": stat.size, "count": stat.count}
+                for stat in statistics[:limit]
+            ]
+        }
+    
+    def list(self) -> List[dict]:
+        return [{"id": snapshot_id, "taken_at": taken_at} for snapshot_id, (taken_at, _) in self._snapshots.items()]
+    
+    async def diff(self, before_id: Optional[int] = None, after_id: Optional[int] = None,
+                   group_by: str = "lineno", limit: int = 25) -> dict:
+        """
+        What was allocated and freed between two snapshots, biggest change
+        first. Defaults to the two latest snapshots.
+        """
+        if group_by not in GROUP_BY:
+            raise ValueError("Invalid group_by")
+        
+        ids = list(self._snapshots)
+        after_id = after_id if after_id is not None else (ids[-1] if ids else None)
+        if before_id is None:
+            earlier = [snapshot_id for snapshot_id in ids if after_id is not None and snapshot_id < after_id]
+            before_id = earlier[-1] if earlier else None
+        if before_id not in self._snapshots or after_id not in self._snapshots:
+            raise ValueError("Snapshot not found")
+        
+        before_at, before = self._snapshots[before_id]
+        after_at, after = self._snapshots[after_id]
+        differences = await asyncio.to_thread(after.compare_to, before, group_by)
+        
+        return {
+            "before": {"id": before_id, "taken_at": before_at},
+            "after": {"id": after_id, "taken_at": after_at},
+            "group_by": group_by,
+            "size_diff_bytes": sum(stat.size_diff for stat in differences),
+            "count_diff": sum(stat.count_diff for stat in differences),
+            "top": [
+                {
+                    "location": _location(stat.traceback, group_by),
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                    "size_bytes": stat.size,
+                    "count": stat.count
+                }
+                for stat in differences[:limit]
+            ]
+        }
+    
+    def clear(self) -> bool:
+        """Drop all snapshots and stop tracemalloc if a snapshot started it; True if it was stopped"""
+        self._snapshots.clear()
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self._started_tracing = False
+            return True
+        return False
+
+
+memory_snapshots = MemorySnapshots(settings.memory_snapshots_max)
@@ -0,0 +1 @@
+# Export of request traces
@@ -0,0 +1,80 @@
+"""
+Trace export to a local JSON-lines file.
+Traces are queued and written by a background thread, so requests never
+wait on the disk; the file rotates at a size limit like a log file.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+from src.infrastructure.config.settings import settings
+
+_STOP = object()
+
+
+class JsonlTraceExporter:
+    """Writes one JSON object per trace to `path`, rotated to path.1 .. path.N at `max_bytes`"""
+    
+    def __init__(self, path: str, max_bytes: int, backup_count: int, max_queued: int = 10000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queued)
+        self.exported = 0
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def export(self, trace: dict):
+        """Queue a trace for writing; dropped if the writer has fallen behind"""
+        if self._thread is None:
+            self._start()
+        try:
+            self.queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+    
+    def close(self):
+        """Write what is queued, then stop the writer"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self.queue.put(_STOP)
+            thread.join()
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Only used for its size-based rotation
+        handler = RotatingFileHandler(
+            self.path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8", delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        try:
+            while True:
+                trace = self.queue.get()
+                if trace is _STOP:
+                    break
+                line = json.dumps(trace, separators=(",", ":"), default=str)
+                handler.handle(logging.makeLogRecord({"msg": line, "args": None}))
+                self.exported += 1
+        finally:
+            handler.close()
+
+
+trace_exporter = JsonlTraceExporter(
+    settings.tracing_file,
+    settings.tracing_file_max_bytes,
+    settings.tracing_file_backup_count
+)
@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session
+from typing import Literal, Optional
+import asyncio
+import os
+import time
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.profiling.cpu_profiler import cpu_profiler, ProfilerBusyError
+from src.infrastructure.profiling.memory_profiler import memory_snapshots, count_instances, rss_bytes
+from src.infrastructure.database.models import TodoModel, UserModel
+from src.domain.entities.todo import Todo
+from src.domain.entities.user import User
+from src.application.dtos.todo.todo_response import TodoResponse
+from src.application.dtos.user.user_response import UserResponse
+from src.presentation.auth import get_current_admin
+from src.presentation.api.traced_route import TracedRoute
+
+
+router = APIRouter(prefix="/admin", tags=["admin"], route_class=TracedRoute)
+
+# Classes whose live instances GET /admin/memory/objects counts
+TRACKED_TYPES = (TodoModel, Todo, TodoResponse, UserModel, User, UserResponse, Session)
+
+
+@router.get("/profile/cpu")
+async def profile_cpu(
+    seconds: float = Query(10, gt=0, le=settings.profiler_max_seconds),
+    interval_ms: float = Query(5, ge=1, le=1000, description="Time between stack samples"),
+    format: Literal["json", "collapsed"] = Query("json"),
+    include_idle: bool = Query(False, description="Keep samples taken while the event loop was waiting for I/O"),
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Sample this worker's event loop for `seconds` while it keeps serving
+    requests (admin only). Returns stack counts in the collapsed format of
+    flamegraph.pl and speedscope, event-loop lag and the slowest coroutine
+    steps; with format=collapsed, only the collapsed stacks as a file.
+    """
+    try:
+        report = await cpu_profiler.profile(seconds, interval_ms / 1000, include_idle=include_idle)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if format == "collapsed":
+        filename = f"cpu-{report['pid']}-{int(time.time())}.collapsed"
+        return Response(
+            content=report["collapsed"],
+            media_type="text/plain",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
+    return report
+
+
+@router.post("/memory/snapshots")
+async def take_memory_snapshot(
+    frames: int = Query(1, ge=1, le=50, description="Stack frames kept per allocation, if this starts tracemalloc"),
+    limit: int = Query(25, ge=1, le=500),
+    admin: dict = Depends(get_current_admin)
+):
+    """
+    Take a tracemalloc snapshot of this worker and list its top allocators
+    (admin only). The first snapshot starts tracemalloc, which only sees
+    allocations made from then on; clear the snapshots to stop it.
+    """
+    return await memory_snapshots.take(frames, limit)
+
+
+@router.get("/memory/snapshots")
+async def list_memory_snapshots(admin: dict = Depends(get_current_admin)):
+    """Snapshots kept by this worker (admin only)"""
+    return {"snapshots": memory_snapshots.list()}
+
+
+@router.delete("/memory/snapshots")
+async def clear_memory_snapshots(admin: dict = Depends(get_current_admin)):
+    """Drop this worker's snapshots and stop tracemalloc (admin only)"""
+    return {"tracing_stopped": memory_snapshots.clear()}
+
+
+@router.get("/memory/diff")
+async def diff_memory_snapshots(
+    before: Optional[int] = Query(None, description="Older snapshot id (default: the one before `after`)"),
+    after: Optional[int] = Query(None, description="Newer snapshot id (default: the latest)"),
+    group_by: Literal["lineno", "filename", "traceback"] = Query("lineno"),
+    limit: int = Query(25, ge=1, le=500),
+    admin: dict = Depends(get_current_admin)
+):
+    """Allocation growth between two snapshots, biggest change first (admin only)"""
+    try:
+        return await memory_snapshots.diff(before, after, group_by, limit)
+    except ValueError as e:
+        status_code = 404 if str(e) == "Snapshot not found" else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
+@router.get("/memory/objects")
+async def count_live_objects(admin: dict = Depends(get_current_admin)):
+    """
+    Live ORM, entity and DTO instances in this worker (admin only). Walks
+    the whole heap in a thread, so it may take a moment on a large worker.
+    """
+    counts = await asyncio.to_thread(count_instances, TRACKED_TYPES)
+    return {"pid": os.getpid(), "rss_bytes": rss_bytes(), "objects": counts}
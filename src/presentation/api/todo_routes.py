@@ -1,15 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Literal, Optional
+import hashlib
 
 from src.application.services.todo_service import TodoService
 from src.application.dtos.todo.create_todo import CreateTodoRequest
+from src.application.dtos.todo.create_todos_bulk import CreateTodosBulkRequest
 from src.application.dtos.todo.update_todo import UpdateTodoRequest
 from src.application.dtos.todo.todo_response import TodoResponse
-from src.presentation.dependencies import get_todo_service
+from src.application.dtos.todo.todo_page import TodoPageResponse
+from src.application.dtos.todo.todo_stats import TodoStatsResponse
+from src.application.dtos.todo.todo_export import EXPORT_MEDIA_TYPES
+from src.application.dtos.todo.import_report import ImportReport
+from src.infrastructure.config.settings import settings
+from src.presentation.dependencies import get_todo_service, get_read_todo_service
 from src.presentation.auth import get_current_user_id
+from src.presentation.api.traced_route import TracedRoute
 
 
-router = APIRouter(prefix="/todos", tags=["todos"])
+router = APIRouter(prefix="/todos", tags=["todos"], route_class=TracedRoute)
+
+
+def _etag(*parts) -> str:
+    """Strong ETag derived from the given parts"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """
+    True if the client's If-None-Match already holds `etag`. "*" is not
+    honoured: it is checked before the resource is loaded, so it would
+    answer 304 for todos that do not exist.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def _cache_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
 
 
 @router.post("/", response_model=TodoResponse)
@@ -26,22 +58,129 @@ async def create_todo(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/", response_model=List[TodoResponse])
-async def get_my_todos(
+@router.post("/bulk", response_model=List[TodoResponse])
+async def create_todos_bulk(
+    request: CreateTodosBulkRequest,
+    current_user_id: str = Depends(get_current_user_id),
+    todo_service: TodoService = Depends(get_todo_service)
+):
+    """Create many todos at once; either all of them are created or none are"""
+    try:
+        # Set user_id from authenticated user
+        request.user_id = current_user_id
+        return await todo_service.create_todos(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/import", response_model=ImportReport)
+async def import_todos(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    resume_from_line: int = Query(1, ge=1, description="First line to import, from a previous report's resume_from_line"),
     current_user_id: str = Depends(get_current_user_id),
     todo_service: TodoService = Depends(get_todo_service)
 ):
-    """Get current user's todos (requires authentication)"""
+    """Import todos from an NDJSON or CSV request body, streamed and written in chunks"""
+    try:
+        return await todo_service.import_todos(
+            current_user_id,
+            request.stream(),
+            format,
+            settings.todos_import_chunk_size,
+            resume_from_line=resume_from_line,
+            max_errors_per_chunk=settings.todos_import_max_errors_per_chunk,
+            max_record_bytes=settings.todos_import_max_record_bytes
+        )
+    except ValueError as e:
+        status_code = 404 if str(e) == "User not found" else 400
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
+@router.get("/", response_model=TodoPageResponse)
+async def get_my_todos(
+    request: Request,
+    limit: int = Query(settings.todos_page_default_limit, ge=1, le=settings.todos_page_max_limit),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    status: Optional[Literal["pending", "completed"]] = Query(None),
+    created_after: Optional[datetime] = Query(None, description="Only todos created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only todos created before this time"),
+    current_user_id: str = Depends(get_current_user_id),
+    todo_service: TodoService = Depends(get_read_todo_service)
+):
+    """Get current user's todos, oldest first, one page at a time (requires authentication)"""
+    try:
+        # Answer revalidations from the version marker alone, without loading todos
+        version = await todo_service.get_todos_version(current_user_id)
+        etag = _etag(current_user_id, version, limit, cursor, status, created_after, created_before)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+        
+        # Already-encoded JSON; returning a Response skips response_model
+        # re-validation while the declared schema still documents the body
+        body = await todo_service.get_user_todos_json(
+            current_user_id,
+            limit,
+            cursor,
+            version=version,
+            status=status,
+            created_after=created_after,
+            created_before=created_before
+        )
+        return Response(content=body, media_type="application/json", headers=_cache_headers(etag))
+    except ValueError as e:
+        status_code = 400 if str(e) in ("Invalid cursor", "Invalid status") else 404
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
+@router.get("/stats", response_model=TodoStatsResponse)
+async def get_my_todo_stats(
+    current_user_id: str = Depends(get_current_user_id),
+    todo_service: TodoService = Depends(get_read_todo_service)
+):
+    """Total, pending and completed counts of the current user's todos (requires authentication)"""
+    return await todo_service.get_todo_stats(current_user_id)
+
+
+@router.get("/search", response_model=TodoPageResponse)
+async def search_my_todos(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to look for in titles and descriptions"),
+    limit: int = Query(settings.todos_page_default_limit, ge=1, le=settings.todos_page_max_limit),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    current_user_id: str = Depends(get_current_user_id),
+    todo_service: TodoService = Depends(get_read_todo_service)
+):
+    """Full-text search the current user's todos, best match first (requires authentication)"""
     try:
-        return await todo_service.get_user_todos(current_user_id)
+        return await todo_service.search_todos(current_user_id, q, limit, cursor)
+    except ValueError as e:
+        status_code = 400 if str(e) == "Invalid cursor" else 404
+        raise HTTPException(status_code=status_code, detail=str(e))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_my_todos(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    current_user_id: str = Depends(get_current_user_id),
+    todo_service: TodoService = Depends(get_read_todo_service)
+):
+    """Download all of the current user's todos as NDJSON or CSV, streamed in chunks"""
+    try:
+        chunks = await todo_service.export_user_todos(current_user_id, format, settings.todos_export_chunk_size)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="todos.{format}"'}
+    )
 
 
 @router.get("/debug", response_model=dict)
 async def debug_todos(
     current_user_id: str = Depends(get_current_user_id),
-    todo_service: TodoService = Depends(get_todo_service)
+    todo_service: TodoService = Depends(get_read_todo_service)
 ):
     """Debug endpoint to check user and todos"""
     try:
@@ -68,11 +207,20 @@ async def debug_todos(
 @router.get("/{todo_id}", response_model=TodoResponse)
 async def get_todo(
     todo_id: str,
+    request: Request,
+    response: Response,
     current_user_id: str = Depends(get_current_user_id),
-    todo_service: TodoService = Depends(get_todo_service)
+    todo_service: TodoService = Depends(get_read_todo_service)
 ):
     try:
-        return await todo_service.get_todo(todo_id, current_user_id)
+        version = await todo_service.get_todos_version(current_user_id)
+        etag = _etag(current_user_id, version, todo_id)
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=_cache_headers(etag))
+        
+        todo = await todo_service.get_todo(todo_id, current_user_id)
+        response.headers.update(_cache_headers(etag))
+        return todo
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -0,0 +1,55 @@
+import time
+from functools import wraps
+from typing import Callable
+
+from fastapi.routing import APIRoute
+
+from src.application.tracing import current_trace, record_span, span
+
+
+def _traced_endpoint(endpoint: Callable) -> Callable:
+    # include_router() builds the route again from the already wrapped endpoint
+    if getattr(endpoint, "__traced__", False):
+        return endpoint
+    name = f"endpoint.{endpoint.__name__}"
+    
+    # wraps() keeps the signature FastAPI reads the parameters from
+    @wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        with span(name):
+            return await endpoint(*args, **kwargs)
+    
+    wrapper.__traced__ = True
+    return wrapper
+
+
+class TracedRoute(APIRoute):
+    """
+    APIRoute that traces the endpoint call and, once it returns, the
+    response validation and serialization FastAPI does with its result
+    ("response.serialize"). Request parsing and dependencies run before
+    the endpoint and are traced where they are defined.
+    """
+    
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _traced_endpoint(endpoint), **kwargs)
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def traced_handler(request):
+            trace = current_trace.get()
+            if trace is None:
+                return await handler(request)
+            
+            with span("route.handler") as handler_span:
+                response = await handler(request)
+                endpoint_span = next(
+                    (s for s in reversed(trace.spans) if s.parent_id == handler_span.id and s.name.startswith("endpoint.")),
+                    None
+                )
+                if endpoint_span is not None and endpoint_span.end is not None:
+                    record_span("response.serialize", endpoint_span.end, time.perf_counter())
+            return response
+        
+        return traced_handler
@@ -5,11 +5,14 @@ from src.application.dtos.user.create_user import CreateUserRequest
 from src.application.dtos.user.login_user import LoginRequest
 from src.application.dtos.user.user_response import UserResponse
 from src.application.dtos.user.login_response import LoginResponse
-from src.presentation.dependencies import get_user_service
+from src.presentation.dependencies import get_user_service, get_read_user_service, get_public_read_user_service
+from src.infrastructure.database.read_routing import recent_writers
 from src.presentation.auth import get_current_user_id
+from src.presentation.api.traced_route import TracedRoute
+from src.infrastructure.auth.password_hasher import PasswordHasherBusyError
 
 
-router = APIRouter(prefix="/users", tags=["users"])
+router = APIRouter(prefix="/users", tags=["users"], route_class=TracedRoute)
 
 
 @router.post("/register", response_model=UserResponse)
@@ -18,7 +21,13 @@ async def register_user(
     user_service: UserService = Depends(get_user_service)
 ):
     try:
-        return await user_service.create_user(request)
+        user = await user_service.create_user(request)
+        
+        # Keep the new user's first reads on the primary
+        recent_writers.mark(user.id)
+        return user
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -30,6 +39,8 @@ async def login_user(
 ):
     try:
         return await user_service.login(request)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -37,7 +48,7 @@ async def login_user(
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
     current_user_id: str = Depends(get_current_user_id),
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_read_user_service)
 ):
     """Get current user's profile (requires authentication)"""
     try:
@@ -49,7 +60,7 @@ async def get_current_user_profile(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
-    user_service: UserService = Depends(get_user_service)
+    user_service: UserService = Depends(get_public_read_user_service)
 ):
     try:
         return await user_service.get_user(user_id)
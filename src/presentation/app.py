@@ -1,9 +1,21 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 import os
 
 from src.presentation.api.user_routes import router as user_router
 from src.presentation.api.todo_routes import router as todo_router
+from src.presentation.api.admin_routes import router as admin_router
+from src.infrastructure.cache.cached_user_repository import user_cache
+from src.application.services.todo_list_cache import todo_list_cache
+from src.infrastructure.database.connection import close_engine
+from src.infrastructure.database.pool_metrics import pool_metrics
+from src.presentation.middleware.request_timing import RequestTimingMiddleware
+from src.presentation.middleware.metrics import MetricsMiddleware
+from src.presentation.middleware.tracing import TracingMiddleware
+from src.infrastructure.tracing.jsonl_exporter import trace_exporter
+from src.infrastructure.metrics.prometheus import metrics_registry, MetricsRegistry
+from src.infrastructure.config.settings import settings
 
 
 def create_app() -> FastAPI:
@@ -30,24 +42,59 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Report per-request timing, including connection pool waits
+    app.add_middleware(RequestTimingMiddleware)
+    
+    # Span trees of sampled and slow requests, written to a local file
+    if settings.tracing_enabled:
+        app.add_middleware(TracingMiddleware)
+    
+    # Request counts and latency per route template, served at /metrics;
+    # added last so it is outermost and times the whole stack
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+    
+    # Return pooled connections to the database on shutdown
+    app.add_event_handler("shutdown", close_engine)
+    # Write out queued traces
+    app.add_event_handler("shutdown", trace_exporter.close)
+    
     # Include routers
     app.include_router(user_router, prefix="/api")
     app.include_router(todo_router, prefix="/api")
+    app.include_router(admin_router, prefix="/api")
     
     @app.get("/")
     async def root():
         return {"message": "Todo App API is running!"}
     
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=metrics_registry.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+    
     @app.get("/health")
     async def health_check():
         try:
             # Try to import database connection to verify it's working
             from src.infrastructure.database.connection import engine
             async with engine.begin() as conn:
-                await conn.execute("SELECT 1")
-            return {"status": "healthy", "database": "connected"}
+                await conn.execute(text("SELECT 1"))
+            return {
+                "status": "healthy",
+                "database": "connected",
+                "db_pool": pool_metrics.snapshot(engine.pool),
+                "user_cache": user_cache.stats(),
+                "todo_list_cache": todo_list_cache.stats()
+            }
         except Exception as e:
-            return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+            return {
+                "status": "unhealthy",
+                "database": "disconnected",
+                "error": str(e),
+                "db_pool": pool_metrics.snapshot(engine.pool),
+                "user_cache": user_cache.stats(),
+                "todo_list_cache": todo_list_cache.stats()
+            }
     
     return app
 
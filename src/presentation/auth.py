@@ -1,6 +1,8 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from src.infrastructure.auth.jwt_handler import jwt_handler
+from src.application.tracing import span
+from src.infrastructure.config.settings import settings
 
 security = HTTPBearer()
 
@@ -9,7 +11,8 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     Dependency to get current authenticated user from JWT token
     """
     token = credentials.credentials
-    payload = jwt_handler.verify_token(token)
+    with span("auth.verify_token"):
+        payload = jwt_handler.verify_token(token)
     
     if payload is None:
         raise HTTPException(
@@ -23,3 +26,14 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 def get_current_user_id(current_user: dict = Depends(get_current_user)) -> str:
     """Extract user ID from current user"""
     return current_user["sub"]
+
+def get_current_admin(current_user: dict = Depends(get_current_user)) -> dict:
+    """
+    Dependency that only lets through users whose id is listed in
+    ADMIN_USER_IDS. Ids, unlike emails, cannot be claimed by registering.
+    """
+    admin_user_ids = {user_id.strip().lower() for user_id in settings.admin_user_ids.split(",") if user_id.strip()}
+    if str(current_user.get("sub", "")).lower() not in admin_user_ids:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    
+    return current_user
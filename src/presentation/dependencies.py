@@ -1,19 +1,67 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
-from src.infrastructure.database.connection import get_session
+from src.infrastructure.database.connection import get_session, get_read_session, AsyncPrimaryReadSessionLocal, AsyncReadSessionLocal
+from src.infrastructure.database.read_routing import recent_writers
 from src.infrastructure.database.repo.user_repository_impl import UserRepositoryImpl
 from src.infrastructure.database.repo.todo_repository_impl import TodoRepositoryImpl
+from src.infrastructure.database.repo.todo_counter_repository_impl import TodoCounterRepositoryImpl
+from src.infrastructure.cache.cached_user_repository import CachedUserRepository, user_cache
 from src.application.services.user_service import UserService
 from src.application.services.todo_service import TodoService
+from src.application.services.todo_list_cache import todo_list_cache
+from src.application.tracing import span
+from src.presentation.auth import get_current_user_id
+
+
+async def get_user_read_session(current_user_id: str = Depends(get_current_user_id)) -> AsyncSession:
+    """Read session for the current user, pinned to the primary right after they wrote"""
+    session_factory = AsyncPrimaryReadSessionLocal if recent_writers.is_pinned(current_user_id) else AsyncReadSessionLocal
+    async with session_factory() as session:
+        yield session
 
 
 async def get_user_service(session: AsyncSession = Depends(get_session)) -> UserService:
-    user_repo = UserRepositoryImpl(session)
-    return UserService(user_repo)
+    with span("dependency.get_user_service"):
+        user_repo = CachedUserRepository(UserRepositoryImpl(session), user_cache)
+        return UserService(user_repo)
+
+
+async def get_read_user_service(session: AsyncSession = Depends(get_user_read_session)) -> UserService:
+    with span("dependency.get_read_user_service"):
+        user_repo = CachedUserRepository(UserRepositoryImpl(session), user_cache)
+        return UserService(user_repo)
+
+
+async def get_public_read_user_service(session: AsyncSession = Depends(get_read_session)) -> UserService:
+    with span("dependency.get_public_read_user_service"):
+        user_repo = CachedUserRepository(UserRepositoryImpl(session), user_cache)
+        return UserService(user_repo)
+
+
+async def get_todo_service(
+    session: AsyncSession = Depends(get_session),
+    current_user_id: str = Depends(get_current_user_id)
+) -> TodoService:
+    with span("dependency.get_todo_service"):
+        user_repo = CachedUserRepository(UserRepositoryImpl(session), user_cache)
+        todo_repo = TodoRepositoryImpl(session)
+        counter_repo = TodoCounterRepositoryImpl(session)
+        todo_service = TodoService(todo_repo, user_repo, list_cache=todo_list_cache, counter_repo=counter_repo)
+    
+    # The user writes through the primary; keep their reads there for a while.
+    # Marked before the endpoint runs because this teardown only runs after
+    # the response has been sent, by when the client may already read again
+    recent_writers.mark(current_user_id)
+    yield todo_service
+    
+    # Restart the window from the end of the write
+    recent_writers.mark(current_user_id)
 
 
-async def get_todo_service(session: AsyncSession = Depends(get_session)) -> TodoService:
-    user_repo = UserRepositoryImpl(session)
-    todo_repo = TodoRepositoryImpl(session)
-    return TodoService(todo_repo, user_repo)
\ No newline at end of file
+async def get_read_todo_service(session: AsyncSession = Depends(get_user_read_session)) -> TodoService:
+    with span("dependency.get_read_todo_service"):
+        user_repo = CachedUserRepository(UserRepositoryImpl(session), user_cache)
+        todo_repo = TodoRepositoryImpl(session)
+        counter_repo = TodoCounterRepositoryImpl(session)
+        return TodoService(todo_repo, user_repo, list_cache=todo_list_cache, counter_repo=counter_repo)
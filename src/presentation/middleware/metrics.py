@@ -0,0 +1,72 @@
+import time
+
+from src.infrastructure.metrics.prometheus import metrics_registry
+
+http_requests_total = metrics_registry.counter(
+    "http_requests_total", "HTTP requests handled, by method, route template and status", ("method", "route", "status")
+)
+http_request_duration_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds", "Time to handle an HTTP request, by method and route template", ("method", "route")
+)
+http_requests_in_progress = metrics_registry.gauge(
+    "http_requests_in_progress", "HTTP requests currently being handled, by method", ("method",)
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+
+def route_template(scope) -> str:
+    """
+    The path template of the route that handled the request, e.g.
+    /api/todos/{todo_id}, so labels stay bounded whatever the raw paths
+    """
+    # FastAPI's router leaves the matched APIRoute in the scope
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    
+    # Plain Starlette routes (e.g. /docs) only leave their endpoint behind
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is not None and app is not None:
+        for candidate in app.routes:
+            if getattr(candidate, "endpoint", None) is endpoint:
+                return candidate.path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that records request counts, latency histograms and
+    in-flight requests in the process metrics registry served at /metrics
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Anything a client can put in a label is bounded here
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        http_requests_in_progress.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_progress.dec((method,))
+            route = route_template(scope)
+            http_requests_total.inc((method, route, str(status_code)))
+            http_request_duration_seconds.observe((method, route), elapsed)
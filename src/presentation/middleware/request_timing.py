@@ -0,0 +1,53 @@
+import time
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.pool_metrics import RequestDbTiming, current_request_timing
+from src.infrastructure.database.query_profiler import RequestQueryStats, current_query_stats, report_repeated_queries
+
+
+class RequestTimingMiddleware:
+    """
+    ASGI middleware that reports where a request spent its time in a
+    Server-Timing header, including time spent waiting for a pooled
+    database connection. In debug it also reports the request's SQL
+    statement count, their total time and how many were repeated.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        timing = RequestDbTiming()
+        token = current_request_timing.set(timing)
+        query_stats = RequestQueryStats(scope)
+        query_token = current_query_stats.set(query_stats)
+        started = time.perf_counter()
+        
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                value = (
+                    f"app;dur={total_ms:.2f}, "
+                    f"db-pool;dur={timing.pool_wait * 1000:.2f};desc=\"{timing.pool_checkouts} checkout(s)\""
+                )
+                headers = list(message.get("headers", [])) + [(b"server-timing", value.encode())]
+                if settings.debug:
+                    # Statements run so far; a streamed body may run more after this
+                    headers += [
+                        (b"x-db-query-count", str(query_stats.count).encode()),
+                        (b"x-db-query-time-ms", f"{query_stats.total_time * 1000:.2f}".encode()),
+                        (b"x-db-repeated-queries", str(len(query_stats.repeated())).encode())
+                    ]
+                message["headers"] = headers
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_timing.reset(token)
+            current_query_stats.reset(query_token)
+            report_repeated_queries(query_stats)
@@ -0,0 +1,50 @@
+import random
+import time
+
+from src.application.tracing import Trace, current_trace
+from src.infrastructure.config.settings import settings
+from src.infrastructure.tracing.jsonl_exporter import trace_exporter
+from src.presentation.middleware.metrics import route_template
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that opens a trace for each request and exports it
+    when the request was head sampled or turned out slow. Spans are
+    always recorded, since slowness is only known at the end.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        trace = Trace(
+            "http.request",
+            sampled=random.random() < settings.tracing_sample_rate,
+            attributes={"method": scope["method"], "path": scope["path"]}
+        )
+        token = current_trace.set(trace)
+        status_code = 500
+        
+        async def send_with_trace_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-trace-id", trace.trace_id.encode())]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        finally:
+            trace.root.end = time.perf_counter()
+            current_trace.reset(token)
+            
+            if trace.sampled or trace.duration * 1000 >= settings.tracing_slow_request_ms:
+                route = route_template(scope)
+                trace.root.name = f"{scope['method']} {route}"
+                trace.root.attributes.update(route=route, status=status_code)
+                trace_exporter.export(trace.to_dict())
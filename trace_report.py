@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Summarize exported request traces: where the slowest requests spent their time.
+
+Reads the trace file and its rotated backups, picks the slowest traces and
+breaks each down by stage, counting each span's own time (its duration
+minus its children's), so the stages of a trace add up to its duration.
+
+Usage:
+    python trace_report.py [--file traces/traces.jsonl] [--top 10] [--route /api/todos/] [--tree]
+"""
+import argparse
+import glob
+import json
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+from src.infrastructure.config.settings import settings
+
+
+def load_traces(path: str) -> List[dict]:
+    traces = []
+    for file_path in [path] + sorted(glob.glob(f"{glob.escape(path)}.*")):
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        traces.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A line cut short by a crash or a rotation in progress
+                        continue
+        except FileNotFoundError:
+            continue
+    return traces
+
+
+def self_times(trace: dict) -> Dict[str, dict]:
+    """Own time and call count per span name; the root's own time is everything untraced"""
+    child_time = defaultdict(float)
+    for span in trace["spans"]:
+        if span["parent_id"] is not None:
+            child_time[span["parent_id"]] += span["duration_ms"]
+
+    stages = defaultdict(lambda: {"calls": 0, "self_ms": 0.0})
+    for span in trace["spans"]:
+        name = "(untraced)" if span["parent_id"] is None else span["name"]
+        stages[name]["calls"] += 1
+        stages[name]["self_ms"] += max(span["duration_ms"] - child_time[span["id"]], 0.0)
+    return stages
+
+
+def print_stages(stages: Dict[str, dict], total_ms: float, indent: str = "  "):
+    for name, stage in sorted(stages.items(), key=lambda item: item[1]["self_ms"], reverse=True):
+        share = stage["self_ms"] / total_ms * 100 if total_ms else 0.0
+        print(f"{indent}{name:<44} {stage['calls']:>5}x {stage['self_ms']:>10.2f} ms {share:>6.1f}%")
+
+
+def print_tree(trace: dict):
+    children = defaultdict(list)
+    for span in trace["spans"]:
+        children[span["parent_id"]].append(span)
+
+    def walk(parent_id, depth):
+        for span in children[parent_id]:
+            details = " ".join(f"{key}={value}" for key, value in (span.get("attributes") or {}).items())
+            print(f"    {span['start_ms']:>9.2f} {'  ' * depth}{span['name']} {span['duration_ms']:.2f} ms {details}")
+            walk(span["id"], depth + 1)
+
+    walk(None, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage breakdown of the slowest exported request traces")
+    parser.add_argument("--file", default=settings.tracing_file, help="Trace file (rotated backups are read too)")
+    parser.add_argument("--top", type=int, default=10, help="How many of the slowest traces to show")
+    parser.add_argument("--route", help="Only traces whose route template contains this")
+    parser.add_argument("--tree", action="store_true", help="Also print each trace's span tree")
+    args = parser.parse_args()
+
+    traces = load_traces(args.file)
+    if args.route:
+        traces = [trace for trace in traces if args.route in trace.get("attributes", {}).get("route", "")]
+    if not traces:
+        print(f"❌ No traces in {args.file}")
+        sys.exit(1)
+
+    slowest = sorted(traces, key=lambda trace: trace["duration_ms"], reverse=True)[:args.top]
+    overall = defaultdict(lambda: {"calls": 0, "self_ms": 0.0})
+    overall_ms = 0.0
+
+    for trace in slowest:
+        attributes = trace.get("attributes", {})
+        reason = "sampled" if trace.get("sampled") else "slow"
+        print(f"{trace['name']} {attributes.get('status', '-')} {trace['duration_ms']:.2f} ms "
+              f"trace={trace['trace_id']} at={trace['started_at']} ({reason})")
+        stages = self_times(trace)
+        print_stages(stages, trace["duration_ms"])
+        if args.tree:
+            print_tree(trace)
+        print()
+
+        overall_ms += trace["duration_ms"]
+        for name, stage in stages.items():
+            overall[name]["calls"] += stage["calls"]
+            overall[name]["self_ms"] += stage["self_ms"]
+
+    print(f"Stages across the {len(slowest)} slowest of {len(traces)} traces ({overall_ms:.2f} ms in total):")
+    print_stages(overall, overall_ms)
+
+
+if __name__ == "__main__":
+    main()